@@ -13,11 +13,13 @@ Usage:
 
 import argparse
 import csv
+import mmap
 import os
 import sys
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -146,7 +148,9 @@ class DataImporter:
                 sql_rewriter=self.sql_rewriter,
                 max_workers=self.config.performance.max_workers,
                 batch_size=self.config.performance.batch_size,
-                logger=self.logger
+                logger=self.logger,
+                use_copy=self.config.performance.use_copy,
+                use_multiprocessing=self.config.performance.use_process_pool
             )
             self.logger.info(f"Traditional parallel importer initialized with {self.config.performance.max_workers} workers")
     
@@ -178,25 +182,32 @@ class DataImporter:
         self.logger.info(f"Using encoding report: {report_file}")
         
         try:
-            with open(report_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Handle both old and new report formats
-                    file_path = row.get('file_path', '')
-                    file_name = row.get('file_name', '')
-                    encoding = row.get('encoding', 'utf-8')
-                    
-                    # If we have file_name but not file_path, construct the path
-                    if file_name and not file_path:
-                        # Assume files are in the source directory
-                        source_dir = Path(self.config.source_directory)
-                        file_path = str(source_dir / file_name)
-                    
-                    if file_path and encoding:
-                        encoding_map[file_path] = encoding
-                        # Also map by filename for easier lookup
-                        if file_name:
-                            encoding_map[file_name] = encoding
+            # Collect keys and encodings in one pass and build the map at once
+            keys = []
+            encodings = []
+            
+            reader = csv.DictReader(self._iter_report_lines(report_file))
+            for row in reader:
+                # Handle both old and new report formats
+                file_path = row.get('file_path', '')
+                file_name = row.get('file_name', '')
+                encoding = row.get('encoding', 'utf-8')
+                
+                # If we have file_name but not file_path, construct the path
+                if file_name and not file_path:
+                    # Assume files are in the source directory
+                    source_dir = Path(self.config.source_directory)
+                    file_path = str(source_dir / file_name)
+                
+                if file_path and encoding:
+                    keys.append(file_path)
+                    encodings.append(encoding)
+                    # Also map by filename for easier lookup
+                    if file_name:
+                        keys.append(file_name)
+                        encodings.append(encoding)
+            
+            encoding_map = dict(zip(keys, encodings))
             
             self.logger.info(f"Loaded encoding information for {len(encoding_map)} files from {report_file.name}")
             
@@ -206,6 +217,16 @@ class DataImporter:
         
         return encoding_map
     
+    @staticmethod
+    def _iter_report_lines(report_file: Path) -> Iterator[str]:
+        """Yield the lines of a UTF-8 report file read through a memory map."""
+        with open(report_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b''):
+                    yield line.decode('utf-8')
+    
     def detect_file_encoding(self, file_path: str) -> str:
         """
         Detect encoding of a file using chardet.
@@ -247,6 +268,10 @@ class DataImporter:
         """
         Discover SQL files in the source directory.
         
+        The discovered list is cached in ./reports/sql_files.index together
+        with the modification times of the directories the files were found
+        in, so repeated runs over an unchanged source tree skip the walk.
+        
         Returns:
             List of SQL file paths
         """
@@ -256,13 +281,87 @@ class DataImporter:
         if not source_dir.exists():
             raise FileNotFoundError(f"Source directory not found: {source_dir}")
         
+        index_file = os.path.join("./reports", "sql_files.index")
+        cached_files = self._load_sql_files_index(index_file, str(source_dir))
+        if cached_files is not None:
+            self.logger.info(f"Loaded {len(cached_files)} SQL files in {source_dir} from {index_file}")
+            return cached_files
+        
         # Find all .sql files
         for sql_file in source_dir.rglob('*.sql'):
             if sql_file.is_file():
                 sql_files.append(str(sql_file))
         
+        sql_files.sort()
         self.logger.info(f"Discovered {len(sql_files)} SQL files in {source_dir}")
-        return sorted(sql_files)
+        
+        self._save_sql_files_index(index_file, str(source_dir), sql_files)
+        return sql_files
+    
+    def _load_sql_files_index(self, index_file: str, source_dir: str) -> Optional[List[str]]:
+        """
+        Load a cached SQL file list if none of its directories changed.
+        
+        Args:
+            index_file: Path to the index file
+            source_dir: Source directory the index must belong to
+            
+        Returns:
+            Cached list of SQL file paths, or None if missing or stale
+        """
+        if not os.path.exists(index_file):
+            return None
+        
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            
+            if not lines or lines[0] != source_dir:
+                return None
+            
+            # An index recording no directories cannot be checked for changes
+            dir_count = int(lines[1])
+            if dir_count == 0:
+                return None
+            
+            for line in lines[2:2 + dir_count]:
+                mtime_ns, directory = line.split('\t', 1)
+                if os.stat(directory).st_mtime_ns != int(mtime_ns):
+                    return None
+            
+            return lines[2 + dir_count:]
+            
+        except (OSError, ValueError, IndexError) as e:
+            self.logger.debug(f"Ignoring SQL file index {index_file}: {str(e)}")
+            return None
+    
+    def _save_sql_files_index(self, index_file: str, source_dir: str, sql_files: List[str]):
+        """
+        Save the discovered SQL file list with its directory modification times.
+        
+        Adding or removing a file changes the modification time of its parent
+        directory, so every directory under source_dir is recorded, including
+        those that contain no SQL files yet.
+        
+        Args:
+            index_file: Path to the index file
+            source_dir: Source directory that was scanned
+            sql_files: Discovered SQL file paths
+        """
+        try:
+            # Like rglob, os.walk does not descend into symlinked directories
+            directories = [directory for directory, _, _ in os.walk(source_dir)]
+            
+            lines = [source_dir, str(len(directories))]
+            lines.extend(f"{os.stat(directory).st_mtime_ns}\t{directory}" for directory in sorted(directories))
+            lines.extend(sql_files)
+            
+            os.makedirs(os.path.dirname(index_file), exist_ok=True)
+            with open(index_file, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+                
+        except OSError as e:
+            self.logger.debug(f"Could not write SQL file index {index_file}: {str(e)}")
     
     def create_import_tasks(self, sql_files: List[str], encoding_map: Dict[str, str]) -> List[ImportTask]:
         """
@@ -542,6 +641,10 @@ class DataImporter:
         """
         self.logger.info("Generating import report...")
         
+        report_dir = "./reports"
+        report_file = os.path.join(report_dir, 'import_report.json')
+        csv_file = os.path.join(report_dir, 'import_summary.csv')
+        
         # Prepare report data
         report_data = {
             'summary': self.import_stats,
@@ -572,18 +675,15 @@ class DataImporter:
                 })
             
             if result.warnings:
-                for warning in result.warnings:
-                    report_data['warnings'].append({
-                        'file': result.file_path,
-                        'warning': warning
-                    })
+                report_data['warnings'].extend(
+                    {'file': result.file_path, 'warning': warning}
+                    for warning in result.warnings
+                )
         
         # Generate report
-        report_file = os.path.join("./reports", 'import_report.json')
         self.report_generator.generate_json_report(report_data, report_file)
         
         # Also generate CSV summary
-        csv_file = os.path.join("./reports", 'import_summary.csv')
         self._generate_csv_summary(results, csv_file)
         
         self.logger.info(f"Import report generated: {report_file}")
@@ -600,17 +700,20 @@ class DataImporter:
             ]
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            
-            for result in results:
-                writer.writerow({
-                    'file_name': os.path.basename(result.file_path),
-                    'table_name': result.table_name,
-                    'success': result.success,
-                    'records_processed': result.records_processed,
-                    'records_failed': result.records_failed,
-                    'processing_time': f"{result.processing_time:.2f}",
-                    'error_message': result.error_message or ''
-                })
+            writer.writerows(self._csv_summary_row(result) for result in results)
+    
+    @staticmethod
+    def _csv_summary_row(result: ImportResult) -> Dict[str, object]:
+        """Build a CSV summary row for a single import result."""
+        return {
+            'file_name': os.path.basename(result.file_path),
+            'table_name': result.table_name,
+            'success': result.success,
+            'records_processed': result.records_processed,
+            'records_failed': result.records_failed,
+            'processing_time': f"{result.processing_time:.2f}",
+            'error_message': result.error_message or ''
+        }
     
     def print_summary(self, results: List[ImportResult]):
         """Print import summary to console."""
@@ -656,6 +759,35 @@ class DataImporter:
             print()
 
 
+@dataclass
+class CliArgs:
+    """Parsed command line arguments."""
+    __slots__ = (
+        'config', 'source_dir', 'target_db', 'target_schema', 'source_db',
+        'db_host', 'db_port', 'db_user', 'db_password', 'max_workers',
+        'batch_size', 'use_copy', 'default_encoding', 'target_encoding',
+        'output_dir', 'log_level', 'verbose'
+    )
+    
+    config: Optional[str]
+    source_dir: Optional[str]
+    target_db: Optional[str]
+    target_schema: str
+    source_db: Optional[str]
+    db_host: str
+    db_port: int
+    db_user: str
+    db_password: Optional[str]
+    max_workers: Optional[int]
+    batch_size: Optional[int]
+    use_copy: bool
+    default_encoding: str
+    target_encoding: str
+    output_dir: str
+    log_level: str
+    verbose: bool
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
     parser = argparse.ArgumentParser(
@@ -758,6 +890,12 @@ Examples:
         help='Number of records to process in each batch (default: from config file)'
     )
     
+    parser.add_argument(
+        '--use-copy',
+        action='store_true',
+        help='Load literal-only INSERT batches with COPY FROM STDIN'
+    )
+    
     # Encoding settings
     parser.add_argument(
         '--default-encoding',
@@ -799,10 +937,23 @@ Examples:
     return parser
 
 
+def parse_arguments(argv: Optional[List[str]] = None) -> CliArgs:
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+        
+    Returns:
+        Parsed arguments
+    """
+    parser = create_argument_parser()
+    return CliArgs(**vars(parser.parse_args(argv)))
+
+
 def main():
     """Main function."""
-    parser = create_argument_parser()
-    args = parser.parse_args()
+    args = parse_arguments()
     
     try:
         # Load configuration
@@ -830,6 +981,8 @@ def main():
             config.performance.max_workers = args.max_workers
         if args.batch_size:
             config.performance.batch_size = args.batch_size
+        if args.use_copy:
+            config.performance.use_copy = True
         if args.target_encoding:
             config.target_encoding = args.target_encoding
         if args.log_level:
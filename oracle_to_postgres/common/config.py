@@ -43,6 +43,8 @@ class PerformanceConfig:
     queue_size: int = 100
     use_streaming: bool = True
     use_multiprocessing: bool = True
+    use_copy: bool = False  # Load literal-only INSERT batches with COPY
+    use_process_pool: bool = False  # Import files in worker processes when not streaming
 
 
 @dataclass
@@ -128,6 +130,8 @@ class Config:
             config.performance.queue_size = perf_data.get('queue_size', config.performance.queue_size)
             config.performance.use_streaming = perf_data.get('use_streaming', config.performance.use_streaming)
             config.performance.use_multiprocessing = perf_data.get('use_multiprocessing', config.performance.use_multiprocessing)
+            config.performance.use_copy = perf_data.get('use_copy', config.performance.use_copy)
+            config.performance.use_process_pool = perf_data.get('use_process_pool', config.performance.use_process_pool)
         
         # Logging configuration
         if 'logging' in data:
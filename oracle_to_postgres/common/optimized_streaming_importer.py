@@ -12,10 +12,23 @@ import threading
 import time
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Callable, Any, Iterator
+from typing import Dict, List, NamedTuple, Optional, Callable, Any, Iterator
 from pathlib import Path
 
 
+class _WorkerConfig(NamedTuple):
+    """Immutable subset of the importer configuration sent to worker processes."""
+    host: str
+    port: int
+    database: str
+    username: str
+    password: str
+    schema: str
+    source_db: str
+    target_db: str
+    target_schema: str
+
+
 @dataclass
 class RawChunk:
     """Raw text chunk from file (before processing)."""
@@ -163,15 +176,14 @@ class LightweightFileReader:
             self.logger.info(f"Completed reading {self.file_path}: {chunk_id} chunks")
 
 
-def process_raw_chunk(raw_chunk: RawChunk, db_config: dict, sql_rewriter_config: dict) -> ProcessedChunk:
+def process_raw_chunk(raw_chunk: RawChunk, worker_config: _WorkerConfig) -> ProcessedChunk:
     """
     Process a raw chunk in a separate process.
     This function will be executed by worker processes.
     
     Args:
         raw_chunk: Raw text chunk to process
-        db_config: Database configuration
-        sql_rewriter_config: SQL rewriter configuration
+        worker_config: Database and SQL rewriter configuration
         
     Returns:
         ProcessedChunk with results
@@ -188,24 +200,21 @@ def process_raw_chunk(raw_chunk: RawChunk, db_config: dict, sql_rewriter_config:
         sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
         
         from oracle_to_postgres.common.database import DatabaseManager, ConnectionInfo
-        from oracle_to_postgres.common.sql_rewriter import SQLRewriter
         
         # Initialize components in worker process
         connection_info = ConnectionInfo(
-            host=db_config['host'],
-            port=db_config['port'],
-            database=db_config['database'],
-            username=db_config['username'],
-            password=db_config['password'],
-            schema=db_config['schema']
+            host=worker_config.host,
+            port=worker_config.port,
+            database=worker_config.database,
+            username=worker_config.username,
+            password=worker_config.password,
+            schema=worker_config.schema
         )
         
         db_manager = DatabaseManager(connection_info=connection_info, pool_size=1)
         
-        sql_rewriter = SQLRewriter(
-            source_db=sql_rewriter_config['source_db'],
-            target_db=sql_rewriter_config['target_db'],
-            target_schema=sql_rewriter_config['target_schema']
+        sql_rewriter = _get_worker_rewriter(
+            worker_config.source_db, worker_config.target_db, worker_config.target_schema
         )
         
         # Parse SQL statements from raw content
@@ -254,6 +263,31 @@ def process_raw_chunk(raw_chunk: RawChunk, db_config: dict, sql_rewriter_config:
         )
 
 
+# SQLRewriters of the current thread, keyed by databases and schema
+_worker_rewriters = threading.local()
+
+
+def _get_worker_rewriter(source_db: str, target_db: str, target_schema: str):
+    """
+    Get the SQLRewriter of this thread for the given databases.
+    
+    Creating a rewriter compiles all of its rules, so it is created once per
+    worker process, or per thread of the threading fallback, and reused for
+    every chunk instead of once per chunk. Threads do not share a rewriter
+    because its rule hit counters are updated without a lock.
+    """
+    rewriters = getattr(_worker_rewriters, 'rewriters', None)
+    if rewriters is None:
+        rewriters = _worker_rewriters.rewriters = {}
+    
+    key = (source_db, target_db, target_schema)
+    if key not in rewriters:
+        from oracle_to_postgres.common.sql_rewriter import SQLRewriter
+        
+        rewriters[key] = SQLRewriter(source_db=source_db, target_db=target_db, target_schema=target_schema)
+    return rewriters[key]
+
+
 def _parse_sql_statements(content: str) -> List[str]:
     """Parse SQL statements from raw content."""
     statements = []
@@ -342,21 +376,19 @@ class OptimizedStreamingImporter:
         self.use_multiprocessing = use_multiprocessing
         self.logger = logger
         
-        # Extract configurations for worker processes
-        self.db_config = {
-            'host': db_manager.connection_info.host,
-            'port': db_manager.connection_info.port,
-            'database': db_manager.connection_info.database,
-            'username': db_manager.connection_info.username,
-            'password': db_manager.connection_info.password,
-            'schema': db_manager.connection_info.schema
-        }
-        
-        self.sql_rewriter_config = {
-            'source_db': sql_rewriter.source_db,
-            'target_db': sql_rewriter.target_db,
-            'target_schema': sql_rewriter.target_schema
-        }
+        # Extract the configuration worker processes need; it is pickled
+        # with every submitted chunk, so keep it to a flat tuple
+        self._wcfg = _WorkerConfig(
+            host=db_manager.connection_info.host,
+            port=db_manager.connection_info.port,
+            database=db_manager.connection_info.database,
+            username=db_manager.connection_info.username,
+            password=db_manager.connection_info.password,
+            schema=db_manager.connection_info.schema,
+            source_db=sql_rewriter.source_db,
+            target_db=sql_rewriter.target_db,
+            target_schema=sql_rewriter.target_schema
+        )
         
         # Statistics
         self.import_stats = {
@@ -421,8 +453,7 @@ class OptimizedStreamingImporter:
                 future = executor.submit(
                     process_raw_chunk, 
                     raw_chunk, 
-                    self.db_config, 
-                    self.sql_rewriter_config
+                    self._wcfg
                 )
                 futures[future] = raw_chunk.chunk_id
                 
@@ -520,7 +551,7 @@ class OptimizedStreamingImporter:
                     break
                 
                 # Process chunk in thread
-                result = process_raw_chunk(raw_chunk, self.db_config, self.sql_rewriter_config)
+                result = process_raw_chunk(raw_chunk, self._wcfg)
                 results.append(result)
                 
                 chunk_queue.task_done()
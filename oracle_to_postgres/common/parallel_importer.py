@@ -2,15 +2,98 @@
 Parallel data importer for Oracle to PostgreSQL migration.
 """
 
+import array
+import codecs
+import contextlib
+import csv
+import io
+import logging
+import mmap
 import os
+import re
+import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Callable, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Callable, Any
 
+from psycopg2.extensions import AsIs
+from psycopg2.extras import execute_values
 
-@dataclass
+from .database import DatabaseManager, ConnectionInfo
+from .logger import Logger
+from .sql_rewriter import RewriteRule, SQLRewriter, SQLStatementSplitter, SQL_STATEMENT_PATTERN
+
+
+# Splits a rewritten INSERT into its "INSERT INTO ... VALUES" head and row list
+INSERT_VALUES_PATTERN = re.compile(
+    r'^\s*(INSERT\s+INTO\s+.+?\bVALUES)\s*(\(.*\))\s*;?\s*$',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Target table and optional column list of an "INSERT INTO ... VALUES" head
+INSERT_TARGET_PATTERN = re.compile(
+    r'^\s*INSERT\s+INTO\s+(.+?)\s*VALUES$',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Literal values that COPY can load as-is: quoted strings (optionally cast to
+# date/timestamp by the rewriter), NULL and plain numbers
+COPY_ROW_START_PATTERN = re.compile(r'\s*\(')
+COPY_ROW_SEPARATOR_PATTERN = re.compile(r'\s*,')
+COPY_LITERAL_PATTERN = re.compile(
+    r"\s*(?:'((?:[^']|'')*)'(?:::(?:date|timestamp))?"
+    r"|(NULL)"
+    r"|([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?))"
+    r"\s*([,)])",
+    re.IGNORECASE
+)
+
+# NULL marker used in the CSV data sent through COPY
+COPY_NULL = '\\N'
+
+# Oracle client commands and comments skipped during import (lowercase)
+ORACLE_COMMAND_PREFIXES = (
+    'prompt ',
+    'set feedback',
+    'set define',
+    'set echo',
+    'set pagesize',
+    'set linesize',
+    'set timing',
+    'set serveroutput',
+    'set verify',
+    'set heading',
+    'spool ',
+    'exit',
+    'quit',
+    'connect ',
+    'disconnect',
+    'commit;',
+    'rollback;',
+    'alter session',
+    'whenever sqlerror',
+    'whenever oserror',
+    '--',
+    '/*',
+    'rem '
+)
+
+# Statements imported as data; everything else is skipped (lowercase)
+VALID_STATEMENT_PREFIXES = ('insert',)
+
+# Number of leading characters needed to classify a statement
+STATEMENT_PREFIX_LENGTH = max(map(len, ORACLE_COMMAND_PREFIXES + VALID_STATEMENT_PREFIXES))
+
+# Number of bytes of a memory-mapped SQL file decoded at a time
+READ_CHUNK_SIZE = 64 * io.DEFAULT_BUFFER_SIZE
+
+# dataclass(slots=True) is only available from Python 3.10
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ImportTask:
     """Single file import task."""
     file_path: str
@@ -19,7 +102,7 @@ class ImportTask:
     target_encoding: str = 'utf-8'
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ImportResult:
     """Result of a single file import."""
     file_path: str
@@ -29,11 +112,11 @@ class ImportResult:
     records_failed: int
     processing_time: float
     error_message: Optional[str] = None
-    warnings: List[str] = None
+    warnings: Tuple[str, ...] = ()
     
     def __post_init__(self):
-        if self.warnings is None:
-            self.warnings = []
+        # Stored as a tuple so the frozen result is immutable and hashable
+        object.__setattr__(self, 'warnings', tuple(self.warnings or ()))
 
 
 @dataclass
@@ -95,19 +178,27 @@ class ImportProgressMonitor:
     def update_file_started(self, file_path: str) -> None:
         """Update progress when a file starts processing."""
         with self._lock:
-            if self._progress:
-                self._progress.current_file = os.path.basename(file_path)
-                self._notify_callbacks()
+            if not self._progress:
+                return
+            self._progress.current_file = os.path.basename(file_path)
+            snapshot = replace(self._progress)
+            callbacks = tuple(self._callbacks)
+        
+        self._notify_callbacks(snapshot, callbacks)
     
     def update_file_completed(self, result: ImportResult) -> None:
         """Update progress when a file completes processing."""
         with self._lock:
-            if self._progress:
-                self._progress.completed_files += 1
-                self._progress.processed_records += result.records_processed
-                self._progress.failed_records += result.records_failed
-                self._progress.current_file = ""
-                self._notify_callbacks()
+            if not self._progress:
+                return
+            self._progress.completed_files += 1
+            self._progress.processed_records += result.records_processed
+            self._progress.failed_records += result.records_failed
+            self._progress.current_file = ""
+            snapshot = replace(self._progress)
+            callbacks = tuple(self._callbacks)
+        
+        self._notify_callbacks(snapshot, callbacks)
     
     def add_progress_callback(self, callback: Callable[[ImportProgress], None]) -> None:
         """Add a progress callback function."""
@@ -119,32 +210,87 @@ class ImportProgressMonitor:
         with self._lock:
             if self._progress:
                 # Return a copy to avoid threading issues
-                return ImportProgress(
-                    total_files=self._progress.total_files,
-                    completed_files=self._progress.completed_files,
-                    total_records=self._progress.total_records,
-                    processed_records=self._progress.processed_records,
-                    failed_records=self._progress.failed_records,
-                    start_time=self._progress.start_time,
-                    current_file=self._progress.current_file
-                )
+                return replace(self._progress)
             return None
     
-    def _notify_callbacks(self) -> None:
-        """Notify all registered callbacks of progress update."""
-        if self._progress:
-            for callback in self._callbacks:
-                try:
-                    callback(self._progress)
-                except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"Error in progress callback: {str(e)}")
+    def _notify_callbacks(self, progress: ImportProgress,
+                          callbacks: Tuple[Callable[[ImportProgress], None], ...]) -> None:
+        """
+        Notify callbacks of a progress update.
+        
+        Called without holding the lock, so slow callbacks do not block other
+        workers and callbacks may call back into the monitor.
+        
+        Args:
+            progress: Snapshot of the progress taken under the lock
+            callbacks: Callbacks registered when the snapshot was taken
+        """
+        for callback in callbacks:
+            try:
+                callback(progress)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error in progress callback: {str(e)}")
+
+
+def parse_literal_rows(values: str) -> Optional[List[List[Optional[str]]]]:
+    """
+    Parse a VALUES list into rows of text values for COPY.
+    
+    Args:
+        values: One or more parenthesised value lists, e.g. "(1, 'a'), (2, NULL)"
+        
+    Returns:
+        List of rows with None for NULL, or None if any value is not a plain
+        literal (function calls, expressions, ...) and COPY cannot be used
+    """
+    rows = []
+    position = 0
+    
+    while True:
+        match = COPY_ROW_START_PATTERN.match(values, position)
+        if not match:
+            return None
+        position = match.end()
+        
+        row = []
+        while True:
+            match = COPY_LITERAL_PATTERN.match(values, position)
+            if not match:
+                return None
+            string_value, null_value, number_value, separator = match.groups()
+            
+            if string_value is not None:
+                value = string_value.replace("''", "'")
+                if value == COPY_NULL:
+                    return None  # Would be read back as NULL
+            elif null_value:
+                value = None
+            else:
+                value = number_value
+            
+            row.append(COPY_NULL if value is None else value)
+            position = match.end()
+            if separator == ')':
+                break
+        rows.append(row)
+        
+        match = COPY_ROW_SEPARATOR_PATTERN.match(values, position)
+        if not match:
+            break
+        position = match.end()
+    
+    if values[position:].strip():
+        return None
+    
+    return rows
 
 
 class SingleFileImporter:
     """Handler for importing a single SQL file."""
     
-    def __init__(self, db_manager, sql_rewriter, batch_size: int = 1000, logger=None):
+    def __init__(self, db_manager, sql_rewriter, batch_size: int = 1000, logger=None,
+                 use_copy: bool = False):
         """
         Initialize single file importer.
         
@@ -153,11 +299,18 @@ class SingleFileImporter:
             sql_rewriter: SQL rewriter instance
             batch_size: Number of records to process in each batch
             logger: Optional logger instance
+            use_copy: Load literal-only INSERT batches with COPY FROM STDIN
         """
         self.db_manager = db_manager
         self.sql_rewriter = sql_rewriter
         self.batch_size = batch_size
         self.logger = logger
+        self.use_copy = use_copy
+        
+        # Queries derived from each "INSERT INTO ... VALUES" head; a dump file
+        # only uses a handful of distinct heads, so build them once
+        self._insert_sql_cache: Dict[str, str] = {}
+        self._copy_sql_cache: Dict[str, Optional[str]] = {}
     
     def import_file(self, task: ImportTask) -> ImportResult:
         """
@@ -178,39 +331,35 @@ class SingleFileImporter:
             if self.logger:
                 self.logger.info(f"Starting import of {task.file_path}")
             
-            # Read and process the file with encoding error handling
-            content = self._read_file_with_fallback(task.file_path, task.encoding)
-            
-            # Split into SQL statements
-            statements = self._split_sql_statements(content)
-            
-            # Process statements in batches
-            batch = []
-            for statement in statements:
-                if statement.strip():
-                    # Filter out Oracle-specific commands
-                    if self._is_valid_sql_statement(statement):
-                        # Rewrite the statement
-                        rewritten = self.sql_rewriter.rewrite_insert_statement(statement)
-                        batch.append(rewritten)
-                    else:
-                        if self.logger:
-                            self.logger.debug(f"Skipping Oracle-specific command: {statement[:50]}...")
-                    
-                    # Process batch when it reaches batch_size
-                    if len(batch) >= self.batch_size:
-                        batch_result = self._execute_batch(batch)
+            # Stream SQL statements from the file with encoding error handling
+            statements = self._iter_file_statements(task.file_path, task.encoding)
+            
+            # Execute each batch on a writer thread while the next one is
+            # parsed and rewritten, so the database round trips overlap with
+            # the CPU work instead of alternating with it. All batches share
+            # one connection, taken from the pool when the first batch is ready.
+            with contextlib.ExitStack() as stack:
+                db_writer = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+                conn = None
+                pending = None
+                for batch in self._iter_batches(statements):
+                    if conn is None:
+                        conn = stack.enter_context(self.db_manager.get_connection())
+                        # The stack unwinds in reverse order: wait for the
+                        # writer before the connection goes back to the pool
+                        stack.callback(db_writer.shutdown, wait=True)
+                    if pending is not None:
+                        batch_result = pending.result()
                         records_processed += batch_result['processed']
                         records_failed += batch_result['failed']
                         warnings.extend(batch_result['warnings'])
-                        batch = []
-            
-            # Process remaining statements
-            if batch:
-                batch_result = self._execute_batch(batch)
-                records_processed += batch_result['processed']
-                records_failed += batch_result['failed']
-                warnings.extend(batch_result['warnings'])
+                    pending = db_writer.submit(self._execute_batch, batch, conn)
+                
+                if pending is not None:
+                    batch_result = pending.result()
+                    records_processed += batch_result['processed']
+                    records_failed += batch_result['failed']
+                    warnings.extend(batch_result['warnings'])
             
             processing_time = time.time() - start_time
             
@@ -246,103 +395,102 @@ class SingleFileImporter:
             )
     
     def _split_sql_statements(self, content: str) -> List[str]:
-        """Split SQL content into individual statements."""
+        """
+        Split SQL content into individual statements.
+        
+        A ';' outside of quoted strings ends a statement and a backslash
+        escapes the following character.
+        """
         statements = []
-        current_statement = ""
-        in_string = False
-        escape_next = False
-        
-        for char in content:
-            if escape_next:
-                current_statement += char
-                escape_next = False
-                continue
-            
-            if char == '\\':
-                escape_next = True
-                current_statement += char
-                continue
-            
-            if char == "'" and not escape_next:
-                in_string = not in_string
-            
-            current_statement += char
-            
-            if char == ';' and not in_string:
-                if current_statement.strip():
-                    statements.append(current_statement.strip())
-                current_statement = ""
         
-        # Add remaining statement if any
-        if current_statement.strip():
-            statements.append(current_statement.strip())
+        for match in SQL_STATEMENT_PATTERN.finditer(content):
+            statement = match.group(0).strip()
+            if statement:
+                statements.append(statement)
         
         return statements
     
     def _is_valid_sql_statement(self, statement: str) -> bool:
         """Check if a statement is a valid SQL statement (not Oracle-specific command)."""
-        statement_lower = statement.lower().strip()
+        # Only the start of the statement is inspected, so avoid lowercasing
+        # the whole (possibly very long) INSERT
+        statement_lower = statement.lstrip()[:STATEMENT_PREFIX_LENGTH].lower()
         
         # Skip empty statements
         if not statement_lower:
             return False
         
-        # Skip Oracle-specific commands
-        oracle_commands = [
-            'prompt ',
-            'set feedback',
-            'set define',
-            'set echo',
-            'set pagesize',
-            'set linesize',
-            'set timing',
-            'set serveroutput',
-            'set verify',
-            'set heading',
-            'spool ',
-            'exit',
-            'quit',
-            'connect ',
-            'disconnect',
-            'commit;',
-            'rollback;',
-            'alter session',
-            'whenever sqlerror',
-            'whenever oserror'
-        ]
-        
-        for oracle_cmd in oracle_commands:
-            if statement_lower.startswith(oracle_cmd):
-                return False
-        
-        # Skip comments (lines starting with --, /*, or REM)
-        if (statement_lower.startswith('--') or 
-            statement_lower.startswith('/*') or 
-            statement_lower.startswith('rem ')):
+        # Skip Oracle-specific commands and comments
+        if statement_lower.startswith(ORACLE_COMMAND_PREFIXES):
             return False
         
         # Only allow INSERT statements for data import
         # Filter out SELECT, UPDATE, DELETE and other non-insert statements
-        valid_sql_starts = [
-            'insert'
-        ]
+        return statement_lower.startswith(VALID_STATEMENT_PREFIXES)
+    
+    def _iter_file_statements(self, file_path: str, primary_encoding: str) -> Iterator[str]:
+        """
+        Iterate over the SQL statements of a file without loading it whole.
         
-        for valid_start in valid_sql_starts:
-            if statement_lower.startswith(valid_start):
-                return True
+        The file is memory-mapped, its encoding is chosen with the fallback
+        mechanism of _select_encoding, and it is then decoded chunk by chunk
+        and split with SQLStatementSplitter. Only the statement currently
+        being read is kept in memory.
         
-        return False
+        Args:
+            file_path: Path to the file
+            primary_encoding: Primary encoding to try first
+            
+        Yields:
+            Non-empty, stripped SQL statements
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self._advise_sequential(mm)
+                encoding, errors = self._select_encoding(mm, file_path, primary_encoding)
+                decoder = io.IncrementalNewlineDecoder(
+                    codecs.getincrementaldecoder(encoding)(errors), translate=True
+                )
+                
+                splitter = SQLStatementSplitter()
+                for start in range(0, len(mm), READ_CHUNK_SIZE):
+                    end = start + READ_CHUNK_SIZE
+                    yield from splitter.feed(decoder.decode(mm[start:end], final=end >= len(mm)))
+                yield from splitter.close()
+    
+    @staticmethod
+    def _advise_sequential(mm: mmap.mmap) -> None:
+        """
+        Tell the kernel a mapping will be read front to back.
+        
+        The kernel then reads ahead in larger windows in the background, so
+        disk reads overlap with decoding and parsing instead of stalling on a
+        page fault every few pages. Pages already read may be dropped early.
+        """
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            try:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            except OSError:
+                pass  # Advice only, reading works without it
     
-    def _read_file_with_fallback(self, file_path: str, primary_encoding: str) -> str:
+    def _select_encoding(self, raw_content, file_path: str, primary_encoding: str) -> Tuple[str, str]:
         """
-        Read file with encoding fallback mechanism.
+        Choose the encoding to decode a file with.
+        
+        Candidate encodings are tried in order until one decodes the whole
+        content strictly; if none does, the primary encoding is used with
+        error replacement.
         
         Args:
-            file_path: Path to the file
+            raw_content: File bytes (bytes or mmap)
+            file_path: Path to the file, for log messages
             primary_encoding: Primary encoding to try first
             
         Returns:
-            File content as string
+            Tuple of (encoding, errors) to decode the content with
         """
         # List of encodings to try in order
         encodings_to_try = [
@@ -371,13 +519,12 @@ class SingleFileImporter:
                 if self.logger:
                     self.logger.debug(f"Trying to read {file_path} with encoding: {encoding}")
                 
-                with open(file_path, 'r', encoding=encoding, errors='strict') as f:
-                    content = f.read()
+                self._check_decodable(raw_content, encoding)
                 
                 if self.logger and encoding != primary_encoding:
                     self.logger.warning(f"Successfully read {file_path} with fallback encoding: {encoding} (original: {primary_encoding})")
                 
-                return content
+                return encoding, 'strict'
                 
             except UnicodeDecodeError as e:
                 last_error = e
@@ -395,42 +542,326 @@ class SingleFileImporter:
             if self.logger:
                 self.logger.warning(f"All encodings failed for {file_path}, trying with error replacement")
             
-            with open(file_path, 'r', encoding=primary_encoding, errors='replace') as f:
-                content = f.read()
+            codecs.lookup(primary_encoding)
             
             if self.logger:
                 self.logger.warning(f"Read {file_path} with error replacement - some characters may be corrupted")
             
-            return content
+            return primary_encoding, 'replace'
             
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Failed to read {file_path} even with error replacement: {str(e)}")
             raise Exception(f"Unable to read file {file_path} with any encoding. Last error: {last_error}")
     
-    def _execute_batch(self, statements: List[str]) -> Dict[str, Any]:
+    @staticmethod
+    def _check_decodable(raw_content, encoding: str) -> None:
+        """Strictly decode content chunk by chunk, raising on the first error."""
+        decoder = codecs.getincrementaldecoder(encoding)('strict')
+        for start in range(0, len(raw_content), READ_CHUNK_SIZE):
+            decoder.decode(raw_content[start:start + READ_CHUNK_SIZE])
+        decoder.decode(b'', final=True)
+    
+    def _iter_batches(self, statements: Iterator[str]) -> Iterator[List[str]]:
+        """
+        Filter, rewrite and group statements into batches.
+        
+        Args:
+            statements: SQL statements read from the file
+            
+        Yields:
+            Lists of at most batch_size rewritten statements
+        """
+        batch = []
+        for statement in statements:
+            if statement.strip():
+                # Filter out Oracle-specific commands
+                if self._is_valid_sql_statement(statement):
+                    # Rewrite the statement
+                    rewritten = self.sql_rewriter.rewrite_insert_statement(statement)
+                    batch.append(rewritten)
+                else:
+                    if self.logger:
+                        self.logger.debug(f"Skipping Oracle-specific command: {statement[:50]}...")
+                
+                # Hand the batch over when it reaches batch_size
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        
+        # Remaining statements
+        if batch:
+            yield batch
+    
+    def _execute_batch(self, statements: List[str], conn=None) -> Dict[str, Any]:
         """
         Execute a batch of SQL statements with proper transaction handling.
         
+        INSERT statements sharing the same "INSERT INTO ... VALUES" head are
+        sent as multi-row INSERTs via execute_values, or loaded with COPY FROM
+        STDIN when use_copy is enabled and all values are literals. If a page
+        of a batched INSERT fails, only that page is split up and retried so
+        that just the offending rows are reported as failed.
+        
         Args:
             statements: List of SQL statements to execute
+            conn: Database connection to use; one is taken from the pool for
+                this batch if omitted
             
         Returns:
             Dictionary with processing results
         """
+        if conn is None:
+            with self.db_manager.get_connection() as conn:
+                return self._execute_batch(statements, conn)
+        
         processed = 0
         failed = 0
         warnings = []
         
-        # Execute each statement in its own transaction to avoid abort issues
+        with conn.cursor() as cursor:
+            for head, rows, group_statements in self._group_insert_rows(statements):
+                if head is None:
+                    group_processed, group_failed = self._execute_statements(
+                        conn, cursor, group_statements, warnings
+                    )
+                elif self.use_copy and self._copy_insert_rows(conn, cursor, head, rows):
+                    group_processed, group_failed = len(rows), 0
+                else:
+                    group_processed, group_failed = self._execute_insert_rows(
+                        conn, cursor, head, rows, group_statements, warnings
+                    )
+                processed += group_processed
+                failed += group_failed
+        
+        return {
+            'processed': processed,
+            'failed': failed,
+            'warnings': warnings
+        }
+    
+    def _group_insert_rows(self, statements: List[str]) -> List[Tuple[Optional[str], List[str], List[str]]]:
+        """
+        Bucket INSERT statements by the table and columns they target.
+        
+        Statements that cannot be batched act as barriers: INSERTs are only
+        bucketed together with the INSERTs between the same two barriers, so
+        they are never moved across other statements.
+        
+        Args:
+            statements: List of SQL statements
+            
+        Returns:
+            List of (head, rows, statements) tuples. head is None for statements
+            that cannot be batched (e.g. INSERT ... SELECT).
+        """
+        groups = []
+        buckets = {}
+        
+        for statement in statements:
+            match = INSERT_VALUES_PATTERN.match(statement)
+            if not match:
+                groups.append((None, [], [statement]))
+                buckets = {}
+                continue
+            
+            head, row = match.groups()
+            bucket = buckets.get(head)
+            if bucket is None:
+                bucket = buckets[head] = (head, [], [])
+                groups.append(bucket)
+            bucket[1].append(row)
+            bucket[2].append(statement)
+        
+        return groups
+    
+    def _copy_insert_rows(self, conn, cursor, head: str, rows: List[str]) -> bool:
+        """
+        Load rows sharing one INSERT head with COPY FROM STDIN.
+        
+        Args:
+            conn: Database connection
+            cursor: Database cursor
+            head: "INSERT INTO ... VALUES" part shared by all rows
+            rows: Parenthesised VALUES lists
+            
+        Returns:
+            True if the rows were loaded, False if COPY is not applicable or
+            failed and the caller should fall back to INSERT
+        """
+        copy_sql = self._copy_sql(head)
+        if copy_sql is None:
+            return False
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
+        for row in rows:
+            values = parse_literal_rows(row)
+            if values is None:
+                return False
+            writer.writerows(values)
+        buffer.seek(0)
+        
+        try:
+            cursor.copy_expert(copy_sql, buffer)
+            conn.commit()
+            return True
+            
+        except Exception as e:
+            self._rollback(conn)
+            if self.logger:
+                self.logger.debug(f"COPY of {len(rows)} rows failed, "
+                                  f"falling back to INSERT: {str(e)[:100]}")
+            return False
+    
+    def _copy_sql(self, head: str) -> Optional[str]:
+        """
+        Get the COPY FROM STDIN command loading rows for an INSERT head.
+        
+        Args:
+            head: "INSERT INTO ... VALUES" part of the statements
+            
+        Returns:
+            COPY command, or None if the target cannot be extracted
+        """
+        if head not in self._copy_sql_cache:
+            target_match = INSERT_TARGET_PATTERN.match(head)
+            self._copy_sql_cache[head] = (
+                f"COPY {target_match.group(1)} FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+                if target_match else None
+            )
+        return self._copy_sql_cache[head]
+    
+    def _insert_values_sql(self, head: str) -> str:
+        """
+        Get the execute_values query for an INSERT head.
+        
+        Args:
+            head: "INSERT INTO ... VALUES" part of the statements
+            
+        Returns:
+            Query with the head escaped for parameter interpolation
+        """
+        sql = self._insert_sql_cache.get(head)
+        if sql is None:
+            sql = self._insert_sql_cache[head] = head.replace('%', '%%') + ' %s'
+        return sql
+    
+    def _execute_insert_rows(self, conn, cursor, head: str, rows: List[str],
+                             statements: List[str], warnings: List[str]) -> Tuple[int, int]:
+        """
+        Insert rows sharing one INSERT head with execute_values, one page at a time.
+        
+        Each page of batch_size rows is committed on its own; a failing page
+        is rolled back and bisected to find the offending rows.
+        
+        Args:
+            conn: Database connection
+            cursor: Database cursor
+            head: "INSERT INTO ... VALUES" part shared by all rows
+            rows: Parenthesised VALUES lists, passed through verbatim
+            statements: Original statements, executed for single failing rows
+            warnings: List collecting warning messages
+            
+        Returns:
+            Tuple of (processed, failed) counts
+        """
+        sql = self._insert_values_sql(head)
+        processed = 0
+        failed = 0
+        
+        for start in range(0, len(rows), self.batch_size):
+            end = start + self.batch_size
+            page_processed, page_failed = self._execute_rows_with_bisect(
+                conn, cursor, sql, rows[start:end], statements[start:end], warnings
+            )
+            processed += page_processed
+            failed += page_failed
+        
+        return processed, failed
+    
+    def _execute_rows_with_bisect(self, conn, cursor, sql: str, rows: List[str],
+                                  statements: List[str], warnings: List[str]) -> Tuple[int, int]:
+        """
+        Insert rows in one statement, splitting them in halves on failure.
+        
+        A page with a single bad row is narrowed down in about 2*log2(n)
+        round trips instead of retrying all n rows one by one. Single rows
+        are executed as their original statement so the reported error is
+        the one for that row.
+        
+        Args:
+            conn: Database connection
+            cursor: Database cursor
+            sql: execute_values query for the shared INSERT head
+            rows: Parenthesised VALUES lists, passed through verbatim
+            statements: Original statements matching rows
+            warnings: List collecting warning messages
+            
+        Returns:
+            Tuple of (processed, failed) counts
+        """
+        try:
+            execute_values(
+                cursor,
+                sql,
+                [(AsIs(row),) for row in rows],
+                template='%s',
+                page_size=len(rows)
+            )
+            conn.commit()
+            return len(rows), 0
+            
+        except Exception as e:
+            self._rollback(conn)
+            if self.logger:
+                self.logger.debug(f"Batched INSERT of {len(rows)} rows failed, "
+                                  f"splitting it up: {str(e)[:100]}")
+        
+        if len(rows) == 1:
+            return self._execute_statements(conn, cursor, statements, warnings)
+        
+        processed = 0
+        failed = 0
+        middle = len(rows) // 2
+        for part_rows, part_statements in ((rows[:middle], statements[:middle]),
+                                           (rows[middle:], statements[middle:])):
+            if len(part_rows) == 1:
+                part_processed, part_failed = self._execute_statements(
+                    conn, cursor, part_statements, warnings
+                )
+            else:
+                part_processed, part_failed = self._execute_rows_with_bisect(
+                    conn, cursor, sql, part_rows, part_statements, warnings
+                )
+            processed += part_processed
+            failed += part_failed
+        
+        return processed, failed
+    
+    def _execute_statements(self, conn, cursor, statements: List[str],
+                            warnings: List[str]) -> Tuple[int, int]:
+        """
+        Execute statements one by one, each in its own transaction.
+        
+        Args:
+            conn: Database connection
+            cursor: Database cursor
+            statements: SQL statements to execute
+            warnings: List collecting warning messages
+            
+        Returns:
+            Tuple of (processed, failed) counts
+        """
+        processed = 0
+        failed = 0
+        
         for statement in statements:
             try:
-                with self.db_manager.get_connection() as conn:
-                    with conn.cursor() as cursor:
-                        cursor.execute(statement)
-                        conn.commit()
-                        processed += 1
-                        
+                cursor.execute(statement)
+                conn.commit()
+                processed += 1
+                
             except Exception as e:
                 failed += 1
                 warning = f"Failed to execute statement: {str(e)[:100]}..."
@@ -438,53 +869,108 @@ class SingleFileImporter:
                 if self.logger:
                     self.logger.warning(warning)
                 
-                # Try to rollback the failed transaction
-                try:
-                    conn.rollback()
-                except:
-                    pass  # Connection might already be closed
+                self._rollback(conn)
         
-        return {
-            'processed': processed,
-            'failed': failed,
-            'warnings': warnings
-        }
+        return processed, failed
+    
+    def _rollback(self, conn) -> None:
+        """Roll back the current transaction, ignoring closed connections."""
+        try:
+            conn.rollback()
+        except Exception:
+            pass  # Connection might already be closed
+
+
+class _ImportWorkerConfig(NamedTuple):
+    """Configuration used to build a SingleFileImporter in a worker process."""
+    connection_info: ConnectionInfo
+    source_db: str
+    target_db: str
+    target_schema: str
+    rewrite_rules: List[RewriteRule]
+    batch_size: int
+    use_copy: bool
+    log_level: Optional[str]  # None when the parent importer has no Logger
+
+
+# Importer of the current worker process, created by _init_import_worker
+_worker_importer: Optional[SingleFileImporter] = None
+
+
+def _init_import_worker(worker_config: _ImportWorkerConfig) -> None:
+    """Create the per-process SingleFileImporter used by _import_file_in_worker."""
+    global _worker_importer
+    
+    logger = Logger(worker_config.log_level) if worker_config.log_level else None
+    db_manager = DatabaseManager(worker_config.connection_info, pool_size=1, logger=logger)
+    sql_rewriter = SQLRewriter(
+        source_db=worker_config.source_db,
+        target_db=worker_config.target_db,
+        target_schema=worker_config.target_schema,
+        logger=logger
+    )
+    # Keep custom rules added to the parent's rewriter
+    sql_rewriter.rewrite_rules = worker_config.rewrite_rules
+    sql_rewriter._build_rule_plans()
+    _worker_importer = SingleFileImporter(
+        db_manager, sql_rewriter, worker_config.batch_size, logger,
+        use_copy=worker_config.use_copy
+    )
+
+
+def _import_file_in_worker(task: ImportTask) -> ImportResult:
+    """Import a single file in a process pool worker."""
+    return _worker_importer.import_file(task)
 
 
 class ParallelImporter:
-    """Multi-threaded data importer for Oracle to PostgreSQL migration."""
+    """Multi-threaded or multi-process data importer for Oracle to PostgreSQL migration."""
+    
+    # Integer statistics, in the order they are stored in the counter array
+    _STAT_FIELDS = ('total_files', 'successful_files', 'failed_files',
+                    'total_records', 'successful_records', 'failed_records')
     
     def __init__(self, db_manager, sql_rewriter, max_workers: int = 4, 
-                 batch_size: int = 1000, logger=None):
+                 batch_size: int = 1000, logger=None, use_copy: bool = False,
+                 use_multiprocessing: bool = False, serial_threshold: int = 1):
         """
         Initialize parallel importer.
         
         Args:
             db_manager: Database manager instance
             sql_rewriter: SQL rewriter instance
-            max_workers: Maximum number of worker threads
+            max_workers: Maximum number of worker threads or processes
             batch_size: Number of records to process in each batch
             logger: Optional logger instance
+            use_copy: Load literal-only INSERT batches with COPY FROM STDIN
+            use_multiprocessing: Import files in worker processes instead of
+                threads so SQL parsing and rewriting are not serialized by the
+                GIL. Only used with a DatabaseManager and SQLRewriter, whose
+                configuration can be recreated in the workers, and ignored on
+                free-threaded (PEP 703) interpreters where threads already run
+                in parallel without pickling tasks and results.
+            serial_threshold: Import this many files or fewer directly in the
+                calling thread instead of starting a worker pool
         """
         self.db_manager = db_manager
         self.sql_rewriter = sql_rewriter
         self.max_workers = max_workers
         self.batch_size = batch_size
         self.logger = logger
+        self.use_copy = use_copy
+        self.use_multiprocessing = use_multiprocessing
+        self.serial_threshold = serial_threshold
+        
+        # Free-threaded builds (Python 3.13t+) can run the GIL disabled
+        self._free_threaded = hasattr(sys, '_is_gil_enabled') and not sys._is_gil_enabled()
         
         # Progress monitoring
         self.progress_monitor = ImportProgressMonitor(logger)
         
-        # Statistics
-        self.import_stats = {
-            'total_files': 0,
-            'successful_files': 0,
-            'failed_files': 0,
-            'total_records': 0,
-            'successful_records': 0,
-            'failed_records': 0,
-            'total_time': 0.0
-        }
+        # Statistics, one counter per _STAT_FIELDS entry
+        self._stats_lock = threading.Lock()
+        self._stats = array.array('q', [0] * len(self._STAT_FIELDS))
+        self._total_time = 0.0
     
     def import_files(self, import_tasks: List[ImportTask], 
                     progress_callback: Optional[Callable[[ImportProgress], None]] = None) -> List[ImportResult]:
@@ -514,21 +1000,56 @@ class ParallelImporter:
         
         # Reset statistics
         self._reset_statistics()
-        self.import_stats['total_files'] = len(import_tasks)
+        with self._stats_lock:
+            self._stats[0] = len(import_tasks)
         
         start_time = time.time()
         results = []
         
+        if len(import_tasks) <= self.serial_threshold:
+            # Too few files to benefit from a worker pool
+            for task in import_tasks:
+                try:
+                    result = self._import_with_monitoring(self._create_file_importer(), task)
+                except Exception as e:
+                    result = self._task_error_result(task, e)
+                results.append(result)
+                self._update_statistics(result)
+        else:
+            self._import_in_pool(import_tasks, results)
+        
+        # Finalize statistics
+        self._total_time = time.time() - start_time
+        
+        if self.logger:
+            stats = self.get_statistics()
+            self.logger.info(f"Parallel import completed: "
+                            f"{stats['successful_files']}/{stats['total_files']} files successful, "
+                            f"{stats['successful_records']} records processed")
+        
+        return results
+    
+    def _import_in_pool(self, import_tasks: List[ImportTask], results: List[ImportResult]) -> None:
+        """
+        Import files in a thread or process pool.
+        
+        Args:
+            import_tasks: List of import tasks
+            results: List collecting import results in completion order
+        """
+        use_processes = self._use_process_pool()
+        max_workers = min(self.max_workers, len(import_tasks))
+        
         # Execute tasks in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with self._create_executor(use_processes, max_workers) as executor:
             # Submit all tasks
             future_to_task = {}
             for task in import_tasks:
-                file_importer = SingleFileImporter(
-                    self.db_manager, self.sql_rewriter, 
-                    self.batch_size, self.logger
-                )
-                future = executor.submit(self._import_with_monitoring, file_importer, task)
+                if use_processes:
+                    future = executor.submit(_import_file_in_worker, task)
+                else:
+                    future = executor.submit(self._import_with_monitoring,
+                                             self._create_file_importer(), task)
                 future_to_task[future] = task
             
             # Collect results as they complete
@@ -536,35 +1057,87 @@ class ParallelImporter:
                 task = future_to_task[future]
                 try:
                     result = future.result()
-                    results.append(result)
-                    self._update_statistics(result)
+                    if use_processes:
+                        # Worker processes cannot reach the monitor themselves;
+                        # progress rides on the result each worker sends back
+                        # anyway, so it costs no extra IPC or shared state
+                        self.progress_monitor.update_file_completed(result)
                     
                 except Exception as e:
-                    # Create error result for failed task
-                    error_result = ImportResult(
-                        file_path=task.file_path,
-                        table_name=task.table_name,
-                        success=False,
-                        records_processed=0,
-                        records_failed=1,
-                        processing_time=0.0,
-                        error_message=f"Task execution failed: {str(e)}"
-                    )
-                    results.append(error_result)
-                    self._update_statistics(error_result)
-                    
-                    if self.logger:
-                        self.logger.error(f"Task execution failed for {task.file_path}: {str(e)}")
-        
-        # Finalize statistics
-        self.import_stats['total_time'] = time.time() - start_time
+                    result = self._task_error_result(task, e)
+                
+                results.append(result)
+                self._update_statistics(result)
+    
+    def _create_file_importer(self) -> SingleFileImporter:
+        """Create a file importer sharing this importer's components."""
+        return SingleFileImporter(
+            self.db_manager, self.sql_rewriter, 
+            self.batch_size, self.logger, self.use_copy
+        )
+    
+    def _task_error_result(self, task: ImportTask, error: Exception) -> ImportResult:
+        """
+        Create the result for a task that raised instead of returning a result.
         
+        Args:
+            task: Import task
+            error: Exception raised by the task
+            
+        Returns:
+            Failed import result
+        """
         if self.logger:
-            self.logger.info(f"Parallel import completed: "
-                            f"{self.import_stats['successful_files']}/{self.import_stats['total_files']} files successful, "
-                            f"{self.import_stats['successful_records']} records processed")
+            self.logger.error(f"Task execution failed for {task.file_path}: {str(error)}")
         
-        return results
+        return ImportResult(
+            file_path=task.file_path,
+            table_name=task.table_name,
+            success=False,
+            records_processed=0,
+            records_failed=1,
+            processing_time=0.0,
+            error_message=f"Task execution failed: {str(error)}"
+        )
+    
+    def _use_process_pool(self) -> bool:
+        """Check whether files should be imported in worker processes."""
+        return (self.use_multiprocessing and
+                not self._free_threaded and
+                isinstance(self.db_manager, DatabaseManager) and
+                isinstance(self.sql_rewriter, SQLRewriter))
+    
+    def _create_executor(self, use_processes: bool, max_workers: int):
+        """
+        Create the executor used to run import tasks.
+        
+        Args:
+            use_processes: Whether to use a process pool
+            max_workers: Number of worker threads or processes
+            
+        Returns:
+            ProcessPoolExecutor whose workers each build their own importer,
+            or ThreadPoolExecutor sharing this importer's components
+        """
+        if not use_processes:
+            return ThreadPoolExecutor(max_workers=max_workers)
+        
+        worker_config = _ImportWorkerConfig(
+            connection_info=self.db_manager.connection_info,
+            source_db=self.sql_rewriter.source_db,
+            target_db=self.sql_rewriter.target_db,
+            target_schema=self.sql_rewriter.target_schema,
+            rewrite_rules=self.sql_rewriter.rewrite_rules,
+            batch_size=self.batch_size,
+            use_copy=self.use_copy,
+            log_level=(logging.getLevelName(self.logger.logger.level)
+                       if isinstance(self.logger, Logger) else None)
+        )
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_import_worker,
+            initargs=(worker_config,)
+        )
     
     def _import_with_monitoring(self, file_importer: SingleFileImporter, 
                               task: ImportTask) -> ImportResult:
@@ -591,30 +1164,34 @@ class ParallelImporter:
     
     def _update_statistics(self, result: ImportResult) -> None:
         """Update import statistics with result."""
-        if result.success:
-            self.import_stats['successful_files'] += 1
-        else:
-            self.import_stats['failed_files'] += 1
+        processed = result.records_processed
+        failed = result.records_failed
+        file_index = 1 if result.success else 2
         
-        self.import_stats['successful_records'] += result.records_processed
-        self.import_stats['failed_records'] += result.records_failed
-        self.import_stats['total_records'] += (result.records_processed + result.records_failed)
+        with self._stats_lock:
+            stats = self._stats
+            stats[file_index] += 1
+            stats[3] += processed + failed
+            stats[4] += processed
+            stats[5] += failed
     
     def _reset_statistics(self) -> None:
         """Reset import statistics."""
-        self.import_stats.update({
-            'total_files': 0,
-            'successful_files': 0,
-            'failed_files': 0,
-            'total_records': 0,
-            'successful_records': 0,
-            'failed_records': 0,
-            'total_time': 0.0
-        })
+        with self._stats_lock:
+            self._stats = array.array('q', [0] * len(self._STAT_FIELDS))
+            self._total_time = 0.0
+    
+    @property
+    def import_stats(self) -> Dict[str, Any]:
+        """Snapshot of the import statistics."""
+        return self.get_statistics()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get current import statistics."""
-        return dict(self.import_stats)
+        with self._stats_lock:
+            stats = dict(zip(self._STAT_FIELDS, self._stats))
+            stats['total_time'] = self._total_time
+        return stats
     
     def get_progress(self) -> Optional[ImportProgress]:
         """Get current import progress."""
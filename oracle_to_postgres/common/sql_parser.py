@@ -3,6 +3,7 @@ SQL statement parsing utilities for Oracle to PostgreSQL migration tool.
 """
 
 import re
+from collections import Counter
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
@@ -95,6 +96,13 @@ class SQLParser:
     # Pattern for quoted strings (handles escaped quotes)
     QUOTED_STRING_PATTERN = re.compile(r"'(?:[^'\\]|\\.)*'")
     
+    # Pattern for unquoted date/timestamp values
+    DATE_VALUE_PATTERN = re.compile(
+        r'\d{4}-\d{2}-\d{2}'                         # YYYY-MM-DD
+        r'|\d{2}/\d{2}/\d{4}'                        # MM/DD/YYYY
+        r'|\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}'     # YYYY-MM-DD HH:MM:SS
+    )
+    
     def __init__(self):
         """Initialize SQL parser."""
         self.type_inference = DataTypeInference()
@@ -271,17 +279,7 @@ class SQLParser:
     
     def _looks_like_date(self, value: str) -> bool:
         """Check if value looks like a date/timestamp."""
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-            r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-            r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}',  # YYYY-MM-DD HH:MM:SS
-        ]
-        
-        for pattern in date_patterns:
-            if re.match(pattern, value):
-                return True
-        
-        return False
+        return bool(self.DATE_VALUE_PATTERN.match(value))
     
     def analyze_table_structure(self, statements: List[InsertStatement]) -> Dict[str, List[ColumnInfo]]:
         """
@@ -348,6 +346,23 @@ class SQLParser:
 class DataTypeInference:
     """Utility for inferring PostgreSQL data types from sample values."""
     
+    # Patterns for recognizing typed string values
+    UUID_PATTERN = re.compile(
+        r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+        re.IGNORECASE
+    )
+    
+    DATE_PATTERN = re.compile(
+        r'^\d{4}-\d{2}-\d{2}$'     # YYYY-MM-DD
+        r'|^\d{2}/\d{2}/\d{4}$'    # MM/DD/YYYY
+        r'|^\d{2}-\d{2}-\d{4}$'    # MM-DD-YYYY
+    )
+    
+    TIMESTAMP_PATTERN = re.compile(
+        r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}'   # YYYY-MM-DD HH:MM:SS
+        r'|^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'     # ISO format
+    )
+    
     def infer_column_type(self, column_name: str, values: List[Any]) -> ColumnInfo:
         """
         Infer column type from sample values.
@@ -371,25 +386,27 @@ class DataTypeInference:
                 nullable=True
             )
         
-        # Analyze value types
-        type_counts = {}
-        max_length = 0
+        # Analyze value types, classifying each distinct value only once
+        # (keyed by type as well, since True == 1 and 1 == 1.0)
+        value_counts = Counter(zip(map(type, non_null_values), non_null_values))
+        type_counts = Counter()
+        for (_, value), count in value_counts.items():
+            type_counts[self._classify_value_type(value)] += count
+        
+        # Track string lengths
+        max_length = max(
+            (len(value) for value_type, value in value_counts if value_type is str),
+            default=0
+        )
+        
+        # Track numeric precision/scale
         max_precision = 0
         max_scale = 0
-        
-        for value in non_null_values:
-            value_type = self._classify_value_type(value)
-            type_counts[value_type] = type_counts.get(value_type, 0) + 1
-            
-            # Track string lengths
-            if isinstance(value, str):
-                max_length = max(max_length, len(value))
-            
-            # Track numeric precision/scale
-            if isinstance(value, (int, float)):
-                precision, scale = self._get_numeric_precision_scale(value)
-                max_precision = max(max_precision, precision)
-                max_scale = max(max_scale, scale)
+        numeric_values = [value for value in non_null_values if isinstance(value, (int, float))]
+        if numeric_values:
+            precisions, scales = zip(*map(self._get_numeric_precision_scale, numeric_values))
+            max_precision = max(precisions)
+            max_scale = max(scales)
         
         # Determine the most appropriate type
         data_type = self._select_best_type(type_counts, max_length, max_precision, max_scale)
@@ -449,8 +466,7 @@ class DataTypeInference:
     
     def _looks_like_uuid(self, value: str) -> bool:
         """Check if string looks like a UUID."""
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        return bool(re.match(uuid_pattern, value, re.IGNORECASE))
+        return bool(self.UUID_PATTERN.match(value))
     
     def _looks_like_json(self, value: str) -> bool:
         """Check if string looks like JSON."""
@@ -460,30 +476,11 @@ class DataTypeInference:
     
     def _looks_like_date(self, value: str) -> bool:
         """Check if string looks like a date."""
-        date_patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
-            r'^\d{2}/\d{2}/\d{4}$',  # MM/DD/YYYY
-            r'^\d{2}-\d{2}-\d{4}$',  # MM-DD-YYYY
-        ]
-        
-        for pattern in date_patterns:
-            if re.match(pattern, value):
-                return True
-        
-        return False
+        return bool(self.DATE_PATTERN.match(value))
     
     def _looks_like_timestamp(self, value: str) -> bool:
         """Check if string looks like a timestamp."""
-        timestamp_patterns = [
-            r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}',  # YYYY-MM-DD HH:MM:SS
-            r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',    # ISO format
-        ]
-        
-        for pattern in timestamp_patterns:
-            if re.match(pattern, value):
-                return True
-        
-        return False
+        return bool(self.TIMESTAMP_PATTERN.match(value))
     
     def _looks_like_boolean_string(self, value: str) -> bool:
         """Check if string represents a boolean value."""
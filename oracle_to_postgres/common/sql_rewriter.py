@@ -2,15 +2,356 @@
 SQL statement rewriting utilities for Oracle to PostgreSQL migration.
 """
 
+import mmap
 import re
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple, Union
+from dataclasses import dataclass, field
 import os
 
+try:
+    import hyperscan
+except ImportError:  # optional, the compatibility checker falls back to re
+    hyperscan = None
+
 from .logger import Logger
 from .encoding_detector import EncodingConverter
 
 
+# One SQL statement in raw file bytes: ';' outside of quoted strings ends a
+# statement and a backslash escapes the following byte (same rules as
+# SQLRewriter._split_sql_statements). Unquoted and quoted runs are consumed
+# whole so the scan stays inside the regex engine.
+SQL_STATEMENT_BYTES_PATTERN = re.compile(
+    rb"(?:[^;'\\]+|\\(?:.|\Z)|'(?:[^'\\]+|\\(?:.|\Z))*(?:'|\Z))*(?:;|\Z)",
+    re.DOTALL
+)
+
+# The same statement rule for decoded text
+SQL_STATEMENT_PATTERN = re.compile(
+    r"(?:[^;'\\]+|\\(?:.|\Z)|'(?:[^'\\]+|\\(?:.|\Z))*(?:'|\Z))*(?:;|\Z)",
+    re.DOTALL
+)
+
+# Used by SQLStatementSplitter on text that may continue in the next chunk:
+# the complete part of a statement, stopping at the ';' that ends it, the
+# quote of an unterminated string or a trailing backslash, and the rest of a
+# quoted string, stopping at its closing quote or a trailing backslash. The
+# loops are unrolled so that a quote left open at the end of a chunk does not
+# make the match backtrack through every earlier string
+SQL_STATEMENT_PREFIX_PATTERN = re.compile(
+    r"[^;'\\]*(?:(?:\\.|'[^'\\]*(?:\\.[^'\\]*)*')[^;'\\]*)*",
+    re.DOTALL
+)
+SQL_QUOTED_REST_PATTERN = re.compile(r"[^'\\]*(?:\\.[^'\\]*)*", re.DOTALL)
+
+# Characters read at a time from files that cannot be split on raw bytes, and
+# the buffer size used when writing rewritten files
+READ_CHUNK_SIZE = 1 << 20
+
+# Rewritten INSERT statements remembered per SQLRewriter, and the longest
+# statement that is remembered (bounds the cache to a few MB)
+REWRITE_CACHE_SIZE = 1024
+REWRITE_CACHE_MAX_LENGTH = 4096
+
+# Statements of a file rewritten and written out together
+REWRITE_BATCH_SIZE = 1000
+
+# INSERT-specific rewrites applied after the rewrite rules, compiled once
+INSERT_STATEMENT_PATTERN = re.compile(r'^\s*INSERT\s+INTO', re.IGNORECASE | re.MULTILINE)
+SELECT_FROM_SCHEMA_TABLE_PATTERN = re.compile(r'SELECT\s+.*?\s+FROM\s+(\w+)\.(\w+)',
+                                              re.IGNORECASE | re.DOTALL)
+INSERT_COLUMNS_PATTERN = re.compile(r'INSERT\s+INTO\s+[^(]+\(([^)]+)\)\s+VALUES', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def is_byte_splittable(encoding: str) -> bool:
+    """
+    Check if SQL text in an encoding can be split into statements on raw bytes.
+    
+    ';', quotes and backslashes must be single ASCII bytes that never occur
+    inside multi-byte characters. GBK, Big5 and Shift-JIS, for example, use
+    0x5C (backslash) as a trail byte, and ISO-2022/UTF-7 encode characters
+    with ASCII bytes.
+    
+    Args:
+        encoding: Encoding name
+        
+    Returns:
+        True if statements can be split on raw bytes
+    """
+    try:
+        if ";'\\".encode(encoding) != b";'\\":
+            return False
+        
+        for char in 'é中ü':
+            try:
+                if any(byte < 0x80 for byte in char.encode(encoding)):
+                    return False
+            except UnicodeEncodeError:
+                continue
+        
+        for special in b";'\\":
+            for lead in range(0x80, 0x100):
+                try:
+                    text = bytes((lead, special)).decode(encoding)
+                except UnicodeDecodeError:
+                    continue
+                if not text.endswith(chr(special)):
+                    return False
+        
+        return True
+        
+    except (LookupError, UnicodeError):
+        return False
+
+
+class SQLStatementSplitter:
+    """
+    Split SQL text that arrives in chunks into statements.
+    
+    Gives the same statements as SQL_STATEMENT_PATTERN on the whole text.
+    The quote and escape state at the end of a chunk is kept, so each chunk
+    is scanned once and a statement spanning many chunks (e.g. after a stray
+    apostrophe) is collected in a list instead of being rescanned.
+    """
+    
+    def __init__(self):
+        """Initialize the splitter at the start of a statement."""
+        self._parts: List[str] = []
+        self._in_string = False
+        self._escape = False
+    
+    def feed(self, text: str) -> List[str]:
+        """
+        Add the next chunk of text.
+        
+        Args:
+            text: Next chunk of SQL text
+            
+        Returns:
+            Non-empty, stripped statements completed by this chunk
+        """
+        statements = []
+        if not text:
+            return statements
+        position = 0
+        
+        # Finish the escape and the quoted string left open by the last chunk
+        if self._escape:
+            position = 1
+            self._escape = False
+        
+        if self._in_string:
+            end = SQL_QUOTED_REST_PATTERN.match(text, position).end()
+            if end >= len(text) - 1 and text[end:] != "'":
+                # Still inside the string, possibly before an escaped character
+                self._escape = end < len(text)
+                self._parts.append(text)
+                return statements
+            position = end + 1
+            self._in_string = False
+        
+        start = 0
+        for match in SQL_STATEMENT_PATTERN.finditer(text, position):
+            if match.end() == len(text):
+                break
+            self._complete(text[start:match.end()], statements)
+            start = match.end()
+        
+        # The statement reaching the end of the chunk: find where its complete
+        # part stops to know the state the next chunk starts in
+        end = SQL_STATEMENT_PREFIX_PATTERN.match(text, max(start, position)).end()
+        if end < len(text) and text[end] == ';':
+            self._complete(text[start:], statements)
+            return statements
+        
+        if end < len(text) and text[end] == "'":
+            end = SQL_QUOTED_REST_PATTERN.match(text, end + 1).end()
+            self._in_string = True
+        self._escape = end < len(text)
+        if start < len(text):
+            self._parts.append(text[start:])
+        
+        return statements
+    
+    def close(self) -> List[str]:
+        """
+        End the text.
+        
+        Returns:
+            The last statement if it is not empty (it may lack a ';')
+        """
+        statements = []
+        self._complete('', statements)
+        self._in_string = False
+        self._escape = False
+        return statements
+    
+    def _complete(self, text: str, statements: List[str]) -> None:
+        """Add the collected parts and text as a statement, if not empty."""
+        if self._parts:
+            self._parts.append(text)
+            text = ''.join(self._parts)
+            self._parts = []
+        
+        statement = text.strip()
+        if statement:
+            statements.append(statement)
+
+
+# Pieces of a rule pattern: an escape (with its hex/octal digits or name), a
+# character class, a {m,n} quantifier, a run of word characters with an
+# optional trailing quantifier, or any other character
+RULE_PATTERN_TOKEN = re.compile(
+    r"\\(?:x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|N\{[^}]*\}|\d+|.)"
+    r"|\[(?:\\.|[^\]])*\]|\{[^}]*\}|\w+(?:[?*+]|\{[^}]*\})?|.",
+    re.DOTALL
+)
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters but
+# whose lower() is not that letter ('İ'.lower() is 'i' plus a combining dot)
+ASCII_CASE_FOLDS = str.maketrans({'\u0131': 'i', '\u017f': 's', '\u0307': None})
+
+# Group references in a replacement: \1 to \99 (not followed by another
+# digit, which would make it an octal escape) and \g<number or name>
+REPLACEMENT_GROUP_REFERENCE = re.compile(r'\\(?:([1-9]\d?)(?!\d)|g<(\d+|[^\W\d]\w*)>)')
+
+
+def extract_rule_trigger(pattern: str, flags: int = 0) -> str:
+    """
+    Find a word that every match of a rule pattern must contain.
+    
+    Only plain patterns are analysed: alternations, inline groups other than
+    (?:...), optional groups and verbose patterns get no trigger, so the
+    rule always runs.
+    
+    Args:
+        pattern: Regular expression of the rule
+        flags: Regular expression flags
+        
+    Returns:
+        Lowercase ASCII trigger word, or an empty string
+    """
+    if flags & re.VERBOSE or '|' in pattern or re.search(r'\((?!\?:)\?|\)[?*{]', pattern):
+        return ""
+    
+    trigger = ""
+    for token in RULE_PATTERN_TOKEN.findall(pattern):
+        if not (token[0].isalnum() or token[0] == '_'):
+            continue
+        
+        # A trailing ?, * or {m,n} makes the last character optional
+        if token[-1] in '?*}':
+            word = token[:token.find('{')] if token[-1] == '}' else token[:-1]
+            word = word[:-1]
+        elif token[-1] == '+':
+            word = token[:-1]
+        else:
+            word = token
+        
+        if word.isascii() and len(word) > len(trigger):
+            trigger = word.lower()
+    
+    return trigger
+
+
+def fold_rule_pattern(pattern: str, flags: int = re.IGNORECASE) -> Optional[str]:
+    """
+    Build a case-sensitive pattern that matches fold_case() text exactly
+    where a case-insensitive rule pattern matches the original text.
+    
+    Literal letters are lowercased. A leading \\bWORD becomes
+    WORD(?<!\\wWORD) so that the pattern starts with a literal, which the
+    regex engine searches for much faster than a word boundary.
+    
+    Args:
+        pattern: Regular expression of the rule
+        flags: Regular expression flags
+        
+    Returns:
+        Folded pattern, or None if the pattern cannot be folded safely
+    """
+    if (not flags & re.IGNORECASE or flags & (re.VERBOSE | re.ASCII) or
+            not pattern.isascii() or re.search(r'\(\?(?!:)', pattern)):
+        return None
+    
+    tokens = RULE_PATTERN_TOKEN.findall(pattern)
+    folded = []
+    
+    for token in tokens:
+        if token.startswith('\\'):
+            # Only case-neutral escapes and escaped punctuation
+            if len(token) != 2 or (token[1].isalnum() and token[1] not in 'bBwWsSdDAZ'):
+                return None
+            folded.append(token)
+        elif token.startswith('['):
+            if re.search(r'[A-Za-z]', re.sub(r'\\[sSwWdD]', '', token)):
+                return None
+            folded.append(token)
+        else:
+            folded.append(token.lower())
+    
+    if len(folded) > 1 and folded[0] == r'\b' and re.fullmatch(r'\w+', folded[1]):
+        word = folded[1]
+        folded[:2] = [f'{word}(?<!\\w{word})']
+    
+    return ''.join(folded)
+
+
+def parse_replacement_template(compiled: Pattern, replacement: str
+                               ) -> Optional[Tuple[Tuple[str, ...], Tuple[int, ...]]]:
+    """
+    Split a replacement into literal text and group references once, so a
+    match can be expanded without Match.expand re-parsing the replacement.
+    
+    Args:
+        compiled: Compiled rule pattern the replacement belongs to
+        replacement: Replacement string
+        
+    Returns:
+        Tuple of (literals, groups) where literals has one more entry than
+        groups, or None if the replacement uses other escapes or references
+        groups the pattern does not have
+    """
+    literals = []
+    groups = []
+    last_end = 0
+    
+    for match in REPLACEMENT_GROUP_REFERENCE.finditer(replacement):
+        number, name = match.groups()
+        if number is None:
+            number = name if name.isdigit() else compiled.groupindex.get(name)
+            if number is None:
+                return None
+        
+        group = int(number)
+        if group > compiled.groups:
+            return None
+        
+        literals.append(replacement[last_end:match.start()])
+        groups.append(group)
+        last_end = match.end()
+    
+    literals.append(replacement[last_end:])
+    if any('\\' in literal for literal in literals):
+        return None
+    
+    return tuple(literals), tuple(groups)
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text so that rule triggers can be found with a plain 'in'."""
+    lower = text.lower()
+    if not lower.isascii():
+        lower = lower.translate(ASCII_CASE_FOLDS)
+    return lower
+
+
 @dataclass
 class RewriteRule:
     """Rule for SQL rewriting."""
@@ -18,6 +359,182 @@ class RewriteRule:
     replacement: str
     description: str
     flags: int = re.IGNORECASE
+    compiled: Pattern = field(init=False, repr=False, compare=False)
+    trigger: str = field(init=False, repr=False, compare=False)
+    scanner: Optional[Pattern] = field(init=False, repr=False, compare=False)
+    is_literal: bool = field(init=False, repr=False, compare=False)
+    template: Optional[Tuple[Tuple[str, ...], Tuple[int, ...]]] = field(init=False, repr=False,
+                                                                         compare=False)
+    substitution: Union[str, Callable[[re.Match], str]] = field(init=False, repr=False,
+                                                                compare=False)
+    
+    def __post_init__(self):
+        """Compile the pattern once instead of on every statement."""
+        self.compiled = re.compile(self.pattern, self.flags)
+        self.trigger = extract_rule_trigger(self.pattern, self.flags)
+        
+        folded = fold_rule_pattern(self.pattern, self.flags)
+        self.scanner = re.compile(folded, self.flags & ~re.IGNORECASE) if folded else None
+        
+        # No groups and a fixed replacement: matches can be replaced by
+        # splicing in the replacement text without the regex engine
+        self.is_literal = self.compiled.groups == 0 and '\\' not in self.replacement
+        self.template = parse_replacement_template(self.compiled, self.replacement)
+        
+        # Replacement to pass to compiled.sub. A str with backslashes is handed
+        # back to the re module on every call to look up its parsed template,
+        # even if nothing matches; the expander is only called per match.
+        if self.template is None or '\\' not in self.replacement:
+            self.substitution = self.replacement
+        else:
+            self.substitution = self.expand
+    
+    def expand(self, match: re.Match) -> str:
+        """Expand the replacement for a match of the pattern using the parsed template."""
+        literals, groups = self.template
+        parts = [literals[0]]
+        for group, literal in zip(groups, literals[1:]):
+            parts.append(match.group(group) or '')
+            parts.append(literal)
+        return ''.join(parts)
+
+
+@dataclass
+class FusedRewriteRules:
+    """Consecutive literal rules applied together in a single regex pass."""
+    compiled: Pattern
+    rules: List[RewriteRule]
+    indices: Tuple[int, ...]
+    triggers: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_rules(cls, indexed_rules: List[Tuple[int, RewriteRule]]) -> 'FusedRewriteRules':
+        """Combine literal rules sharing the same flags into one alternation."""
+        indices = tuple(index for index, _ in indexed_rules)
+        rules = [rule for _, rule in indexed_rules]
+        pattern = '|'.join(f'({rule.pattern})' for rule in rules)
+        
+        # The run can only be skipped if every rule in it has a trigger
+        triggers = ()
+        if all(rule.trigger for rule in rules):
+            triggers = tuple(dict.fromkeys(rule.trigger for rule in rules))
+        
+        return cls(re.compile(pattern, rules[0].flags), rules, indices, triggers)
+
+
+# PostgreSQL only parses ASCII digits in date literals, so the date patterns
+# below use re.ASCII: \d and \s then skip e.g. full-width digits, which
+# would otherwise be reordered and cast into an invalid date
+DATE_PATTERN_FLAGS = re.IGNORECASE | re.ASCII
+
+# Common Oracle date formats that need conversion, most specific first
+DATE_FORMAT_RULES = [
+    # DD-MM-YYYY HH24:MI:SS format with timestamp cast
+    RewriteRule(
+        pattern=r"'(\d{2})-(\d{2})-(\d{4})\s+(\d{2}):(\d{2}):(\d{2})'::timestamp",
+        replacement=r"'\3-\2-\1 \4:\5:\6'::timestamp",
+        description='DD-MM-YYYY HH24:MI:SS to YYYY-MM-DD HH24:MI:SS with timestamp cast',
+        flags=DATE_PATTERN_FLAGS
+    ),
+    # DD-MM-YYYY HH24:MI:SS format without cast - add timestamp cast
+    RewriteRule(
+        pattern=r"'(\d{2})-(\d{2})-(\d{4})\s+(\d{2}):(\d{2}):(\d{2})'(?!::)",
+        replacement=r"'\3-\2-\1 \4:\5:\6'::timestamp",
+        description='DD-MM-YYYY HH24:MI:SS to YYYY-MM-DD HH24:MI:SS with timestamp cast',
+        flags=DATE_PATTERN_FLAGS
+    ),
+    # DD-MM-YYYY format with date cast
+    RewriteRule(
+        pattern=r"'(\d{2})-(\d{2})-(\d{4})'::date",
+        replacement=r"'\3-\2-\1'::date",
+        description='DD-MM-YYYY to YYYY-MM-DD with date cast',
+        flags=DATE_PATTERN_FLAGS
+    ),
+    # DD-MM-YYYY format without cast - add date cast
+    RewriteRule(
+        pattern=r"'(\d{2})-(\d{2})-(\d{4})'(?!::)(?!\s+\d{2}:)",
+        replacement=r"'\3-\2-\1'::date",
+        description='DD-MM-YYYY to YYYY-MM-DD with date cast',
+        flags=DATE_PATTERN_FLAGS
+    ),
+    # DD/MM/YYYY HH24:MI:SS format
+    RewriteRule(
+        pattern=r"'(\d{2})/(\d{2})/(\d{4})\s+(\d{2}):(\d{2}):(\d{2})'(?!::)",
+        replacement=r"'\3-\2-\1 \4:\5:\6'::timestamp",
+        description='DD/MM/YYYY HH24:MI:SS to YYYY-MM-DD HH24:MI:SS with timestamp cast',
+        flags=DATE_PATTERN_FLAGS
+    ),
+    # DD/MM/YYYY format
+    RewriteRule(
+        pattern=r"'(\d{2})/(\d{2})/(\d{4})'(?!::)(?!\s+\d{2}:)",
+        replacement=r"'\3-\2-\1'::date",
+        description='DD/MM/YYYY to YYYY-MM-DD with date cast',
+        flags=DATE_PATTERN_FLAGS
+    ),
+    # DD.MM.YYYY HH24:MI:SS format
+    RewriteRule(
+        pattern=r"'(\d{2})\.(\d{2})\.(\d{4})\s+(\d{2}):(\d{2}):(\d{2})'(?!::)",
+        replacement=r"'\3-\2-\1 \4:\5:\6'::timestamp",
+        description='DD.MM.YYYY HH24:MI:SS to YYYY-MM-DD HH24:MI:SS with timestamp cast',
+        flags=DATE_PATTERN_FLAGS
+    ),
+    # DD.MM.YYYY format
+    RewriteRule(
+        pattern=r"'(\d{2})\.(\d{2})\.(\d{4})'(?!::)(?!\s+\d{2}:)",
+        replacement=r"'\3-\2-\1'::date",
+        description='DD.MM.YYYY to YYYY-MM-DD with date cast',
+        flags=DATE_PATTERN_FLAGS
+    ),
+]
+
+# Casts added after the format conversions (not counted in the statistics)
+DATE_CAST_RULES = [
+    # Look for patterns like 'YYYY-MM-DD HH:MM:SS' that don't have explicit casting
+    RewriteRule(
+        pattern=r"'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'(?!::)",
+        replacement=r"'\1'::timestamp",
+        description='Add timestamp cast to YYYY-MM-DD HH24:MI:SS',
+        flags=DATE_PATTERN_FLAGS
+    ),
+    # Look for patterns like 'YYYY-MM-DD' that don't have explicit casting
+    RewriteRule(
+        pattern=r"'(\d{4}-\d{2}-\d{2})'(?!::)(?!\s+\d{2}:)",
+        replacement=r"'\1'::date",
+        description='Add date cast to YYYY-MM-DD',
+        flags=DATE_PATTERN_FLAGS
+    ),
+    # Handle edge case: dates that already have timestamp cast but wrong format
+    # Pattern: '12-07-2022 09:17:22'::timestamp -> '2022-07-12 09:17:22'::timestamp
+    RewriteRule(
+        pattern=r"'(\d{2})-(\d{2})-(\d{4}\s+\d{2}:\d{2}:\d{2})'::timestamp",
+        replacement=r"'\3-\2-\1'::timestamp",
+        description='Reorder DD-MM-YYYY HH24:MI:SS with timestamp cast',
+        flags=DATE_PATTERN_FLAGS
+    ),
+]
+
+# Oracle history views map to the PostgreSQL tables without the V_HIS_
+# prefix (applied in order, not counted in the statistics)
+TABLE_NAME_RULES = [
+    # "schema"."V_HIS_TABLENAME" -> "schema"."TABLENAME"
+    RewriteRule(
+        pattern=r'"([^"]+)"\."V_HIS_([^"]+)"',
+        replacement=r'"\1"."\2"',
+        description='Remove V_HIS_ prefix from quoted table names'
+    ),
+    # Also handle unquoted versions: schema.V_HIS_TABLENAME -> schema.TABLENAME
+    RewriteRule(
+        pattern=r'(\w+)\.V_HIS_(\w+)',
+        replacement=r'\1.\2',
+        description='Remove V_HIS_ prefix from schema-qualified table names'
+    ),
+    # Handle cases where V_HIS_ appears without schema: V_HIS_TABLENAME -> TABLENAME
+    RewriteRule(
+        pattern=r'\bV_HIS_(\w+)\b',
+        replacement=r'\1',
+        description='Remove V_HIS_ prefix from table names'
+    ),
+]
 
 
 class SQLRewriter:
@@ -42,8 +559,22 @@ class SQLRewriter:
         # Initialize rewrite rules
         self.rewrite_rules = self._initialize_rewrite_rules()
         
-        # Statistics
-        self.rewrite_stats = {}
+        # Table name mapping and schema qualification of INSERT statements,
+        # applied after the rewrite rules (not counted in the statistics)
+        self._table_rule_plan = list(enumerate(self._initialize_table_rules()))
+        
+        # Statistics: rewrite rules and date format rules are counted by
+        # their index in preallocated arrays, so recording a hit never grows
+        # a dict; rewrite_stats holds counts merged in by description
+        self.rewrite_stats = Counter()
+        self._rule_counts = array('Q')
+        self._date_rule_counts = array('Q', [0]) * len(DATE_FORMAT_RULES)
+        
+        # Dumps repeat identical INSERT statements (e.g. unchanged rows of
+        # history views), which are only rewritten once
+        self._rewrite_insert_cached = lru_cache(maxsize=REWRITE_CACHE_SIZE)(self._rewrite_insert)
+        
+        self._build_rule_plans()
     
     def _initialize_rewrite_rules(self) -> List[RewriteRule]:
         """Initialize SQL rewrite rules."""
@@ -223,6 +754,32 @@ class SQLRewriter:
         
         return rules
     
+    def _initialize_table_rules(self) -> List[RewriteRule]:
+        """
+        Initialize the table name rules applied to INSERT statements.
+        
+        The target schema is part of the replacements, so no callback
+        formats it for every match.
+        """
+        target_schema = self.target_schema.replace('\\', r'\\')
+        
+        return TABLE_NAME_RULES + [
+            # Handle any remaining unqualified table references
+            # This catches cases where tables don't have schema prefixes
+            RewriteRule(
+                pattern=r'INSERT\s+INTO\s+(?!")([^.\s"]+)(?!")',
+                replacement=rf'INSERT INTO "{target_schema}"."\1"',
+                description="Add target schema to unqualified tables in INSERT statements"
+            ),
+            # Handle remaining schema.table patterns that weren't caught by the main rules
+            # This is a fallback for any remaining schema references
+            RewriteRule(
+                pattern=r'INSERT\s+INTO\s+(\w+)\.(\w+)',
+                replacement=rf'INSERT INTO "{target_schema}"."\2"',
+                description="Replace remaining schema in INSERT statements"
+            ),
+        ]
+    
     def rewrite_insert_statement(self, statement: str) -> str:
         """
         Rewrite a single INSERT statement.
@@ -233,209 +790,113 @@ class SQLRewriter:
         Returns:
             Rewritten INSERT statement
         """
-        rewritten = statement
+        if len(statement) <= REWRITE_CACHE_MAX_LENGTH:
+            rewritten, rule_hits, date_hits = self._rewrite_insert_cached(statement)
+        else:
+            rewritten, rule_hits, date_hits = self._rewrite_insert(statement)
         
-        # Apply all rewrite rules
-        for rule in self.rewrite_rules:
-            old_statement = rewritten
-            rewritten = re.sub(rule.pattern, rule.replacement, rewritten, flags=rule.flags)
-            
-            # Track statistics
-            if old_statement != rewritten:
-                self.rewrite_stats[rule.description] = self.rewrite_stats.get(rule.description, 0) + 1
-        
-        # Additional specific processing for INSERT statements
-        rewritten = self._process_insert_specific(rewritten)
+        # Statistics are recorded for every statement, cached or not
+        self._record_hits(rule_hits, date_hits)
         
         return rewritten
     
-    def _process_insert_specific(self, statement: str) -> str:
-        """Process INSERT-specific transformations."""
-        # First, handle table name mapping (remove Oracle view prefixes)
-        statement = self._map_table_names(statement)
-        
-        # Handle any remaining unqualified table references
-        # This catches cases where tables don't have schema prefixes
-        insert_pattern = r'INSERT\s+INTO\s+(?!")([^.\s"]+)(?!")'
-        
-        def add_schema(match):
-            table_name = match.group(1)
-            return f'INSERT INTO "{self.target_schema}"."{table_name}"'
+    def _rewrite_insert(self, statement: str) -> Tuple[str, Tuple[int, ...], Tuple[int, ...]]:
+        """
+        Rewrite a single INSERT statement without recording statistics.
         
-        statement = re.sub(insert_pattern, add_schema, statement, flags=re.IGNORECASE)
+        Args:
+            statement: Original INSERT statement
+            
+        Returns:
+            Tuple of (rewritten statement, indices of the rewrite rules that
+            changed it, indices of the date format rules that changed it)
+        """
+        rule_hits = []
+        date_hits = []
         
-        # Handle remaining schema.table patterns that weren't caught by the main rules
-        # This is a fallback for any remaining schema references
-        remaining_schema_pattern = r'INSERT\s+INTO\s+(\w+)\.(\w+)'
+        # Apply all rewrite rules
+        rewritten = self._apply_rule_plan(statement, self._insert_rule_plan, rule_hits)
         
-        def replace_remaining_schema(match):
-            schema = match.group(1)
-            table = match.group(2)
-            return f'INSERT INTO "{self.target_schema}"."{table}"'
+        # Additional specific processing for INSERT statements
+        rewritten = self._process_insert_specific(rewritten, date_hits)
         
-        statement = re.sub(remaining_schema_pattern, replace_remaining_schema, statement, flags=re.IGNORECASE)
+        return rewritten, tuple(rule_hits), tuple(date_hits)
+    
+    def _record_hits(self, rule_hits: Iterable[int], date_hits: Iterable[int] = ()) -> None:
+        """Add rewrites that changed a statement to the statistics."""
+        counts = self._rule_counts
+        for index in rule_hits:
+            counts[index] += 1
+        
+        date_counts = self._date_rule_counts
+        for index in date_hits:
+            date_counts[index] += 1
+    
+    def _process_insert_specific(self, statement: str, hits: List[int]) -> str:
+        """Process INSERT-specific transformations, adding the applied date conversions to hits."""
+        # First, handle table name mapping (remove Oracle view prefixes), then
+        # qualify the remaining table references with the target schema. The
+        # rules are skipped when their trigger word is missing, like the
+        # rewrite rules.
+        statement = self._apply_rule_plan(statement, self._table_rule_plan, [])
         
         # Also handle SELECT statements within INSERT (INSERT INTO ... SELECT FROM ...)
         # Replace any remaining schema references in subqueries
-        select_from_pattern = r'SELECT\s+.*?\s+FROM\s+(\w+)\.(\w+)'
-        
-        def replace_select_schema(match):
-            full_match = match.group(0)
-            schema = match.group(1)
-            table = match.group(2)
-            return full_match.replace(f'{schema}.{table}', f'"{self.target_schema}"."{table}"')
-        
-        statement = re.sub(select_from_pattern, replace_select_schema, statement, flags=re.IGNORECASE | re.DOTALL)
+        statement = SELECT_FROM_SCHEMA_TABLE_PATTERN.sub(self._replace_select_schema, statement)
         
         # Quote column names to preserve case for PostgreSQL compatibility
         statement = self._quote_column_names(statement)
         
         # Convert date formats for PostgreSQL compatibility
-        statement = self._convert_date_formats(statement)
+        statement = self._convert_date_formats(statement, hits)
         
         return statement
     
-    def _map_table_names(self, statement: str) -> str:
-        """Map Oracle table/view names to PostgreSQL table names."""
-        # Remove V_HIS_ prefix from table names (Oracle views -> PostgreSQL tables)
-        # Pattern: "schema"."V_HIS_TABLENAME" -> "schema"."TABLENAME"
-        v_his_pattern = r'"([^"]+)"\."V_HIS_([^"]+)"'
-        statement = re.sub(v_his_pattern, r'"\1"."\2"', statement, flags=re.IGNORECASE)
-        
-        # Also handle unquoted versions: schema.V_HIS_TABLENAME -> schema.TABLENAME
-        v_his_unquoted_pattern = r'(\w+)\.V_HIS_(\w+)'
-        statement = re.sub(v_his_unquoted_pattern, r'\1.\2', statement, flags=re.IGNORECASE)
-        
-        # Handle cases where V_HIS_ appears without schema: V_HIS_TABLENAME -> TABLENAME
-        v_his_bare_pattern = r'\bV_HIS_(\w+)\b'
-        statement = re.sub(v_his_bare_pattern, r'\1', statement, flags=re.IGNORECASE)
-        
-        return statement
+    def _replace_select_schema(self, match: re.Match) -> str:
+        """Replace the schema of a table in an INSERT ... SELECT subquery."""
+        full_match = match.group(0)
+        schema = match.group(1)
+        table = match.group(2)
+        return full_match.replace(f'{schema}.{table}', f'"{self.target_schema}"."{table}"')
     
     def _quote_column_names(self, statement: str) -> str:
         """Quote column names in INSERT statements to preserve case for PostgreSQL compatibility."""
         # Only quote column names if they are explicitly listed in the INSERT statement
         # Pattern to match INSERT INTO table (column1, column2, ...) VALUES
-        insert_columns_pattern = r'INSERT\s+INTO\s+[^(]+\(([^)]+)\)\s+VALUES'
-        
-        def quote_columns(match):
-            columns_part = match.group(1)
-            # Split by comma and add quotes to each column name
-            columns = []
-            for col in columns_part.split(','):
-                col = col.strip()
-                # Only add quotes if not already quoted and it's a valid column name
-                if not (col.startswith('"') and col.endswith('"')) and col.replace('_', '').replace(' ', '').isalnum():
-                    columns.append(f'"{col}"')
-                else:
-                    # Already quoted or not a simple column name, keep as is
-                    columns.append(col)
-            
-            # Reconstruct the match with quoted column names
-            return match.group(0).replace(match.group(1), ', '.join(columns))
-        
-        statement = re.sub(insert_columns_pattern, quote_columns, statement, flags=re.IGNORECASE)
+        return INSERT_COLUMNS_PATTERN.sub(self._quote_columns, statement)
+    
+    @staticmethod
+    def _quote_columns(match: re.Match) -> str:
+        """Quote the column names of an INSERT column list."""
+        columns_part = match.group(1)
+        # Split by comma and add quotes to each column name
+        columns = []
+        for col in columns_part.split(','):
+            col = col.strip()
+            # Only add quotes if not already quoted and it's a valid column name
+            if not (col.startswith('"') and col.endswith('"')) and col.replace('_', '').replace(' ', '').isalnum():
+                columns.append(f'"{col}"')
+            else:
+                # Already quoted or not a simple column name, keep as is
+                columns.append(col)
         
-        return statement
+        # Reconstruct the match with quoted column names
+        return match.group(0).replace(match.group(1), ', '.join(columns))
     
-    def _convert_date_formats(self, statement: str) -> str:
+    def _convert_date_formats(self, statement: str, hits: List[int]) -> str:
         """Convert various date formats to PostgreSQL-compatible format with explicit casting."""
-        # Common Oracle date formats that need conversion
-        date_patterns = [
-            # DD-MM-YYYY HH24:MI:SS format with timestamp cast
-            {
-                'pattern': r"'(\d{2})-(\d{2})-(\d{4})\s+(\d{2}):(\d{2}):(\d{2})'::timestamp",
-                'replacement': r"'\3-\2-\1 \4:\5:\6'::timestamp",
-                'description': 'DD-MM-YYYY HH24:MI:SS to YYYY-MM-DD HH24:MI:SS with timestamp cast'
-            },
-            # DD-MM-YYYY HH24:MI:SS format without cast - add timestamp cast
-            {
-                'pattern': r"'(\d{2})-(\d{2})-(\d{4})\s+(\d{2}):(\d{2}):(\d{2})'(?!::)",
-                'replacement': r"'\3-\2-\1 \4:\5:\6'::timestamp",
-                'description': 'DD-MM-YYYY HH24:MI:SS to YYYY-MM-DD HH24:MI:SS with timestamp cast'
-            },
-            # DD-MM-YYYY format with date cast
-            {
-                'pattern': r"'(\d{2})-(\d{2})-(\d{4})'::date",
-                'replacement': r"'\3-\2-\1'::date",
-                'description': 'DD-MM-YYYY to YYYY-MM-DD with date cast'
-            },
-            # DD-MM-YYYY format without cast - add date cast
-            {
-                'pattern': r"'(\d{2})-(\d{2})-(\d{4})'(?!::)(?!\s+\d{2}:)",
-                'replacement': r"'\3-\2-\1'::date",
-                'description': 'DD-MM-YYYY to YYYY-MM-DD with date cast'
-            },
-            # DD/MM/YYYY HH24:MI:SS format
-            {
-                'pattern': r"'(\d{2})/(\d{2})/(\d{4})\s+(\d{2}):(\d{2}):(\d{2})'(?!::)",
-                'replacement': r"'\3-\2-\1 \4:\5:\6'::timestamp",
-                'description': 'DD/MM/YYYY HH24:MI:SS to YYYY-MM-DD HH24:MI:SS with timestamp cast'
-            },
-            # DD/MM/YYYY format
-            {
-                'pattern': r"'(\d{2})/(\d{2})/(\d{4})'(?!::)(?!\s+\d{2}:)",
-                'replacement': r"'\3-\2-\1'::date",
-                'description': 'DD/MM/YYYY to YYYY-MM-DD with date cast'
-            },
-            # DD.MM.YYYY HH24:MI:SS format
-            {
-                'pattern': r"'(\d{2})\.(\d{2})\.(\d{4})\s+(\d{2}):(\d{2}):(\d{2})'(?!::)",
-                'replacement': r"'\3-\2-\1 \4:\5:\6'::timestamp",
-                'description': 'DD.MM.YYYY HH24:MI:SS to YYYY-MM-DD HH24:MI:SS with timestamp cast'
-            },
-            # DD.MM.YYYY format
-            {
-                'pattern': r"'(\d{2})\.(\d{2})\.(\d{4})'(?!::)(?!\s+\d{2}:)",
-                'replacement': r"'\3-\2-\1'::date",
-                'description': 'DD.MM.YYYY to YYYY-MM-DD with date cast'
-            }
-        ]
-        
         # Apply date format conversions in order (most specific first)
-        for date_pattern in date_patterns:
+        for index, rule in enumerate(DATE_FORMAT_RULES):
             old_statement = statement
-            statement = re.sub(
-                date_pattern['pattern'], 
-                date_pattern['replacement'], 
-                statement, 
-                flags=re.IGNORECASE
-            )
+            statement = rule.compiled.sub(rule.substitution, statement)
             
             # Track statistics
             if old_statement != statement:
-                self.rewrite_stats[date_pattern['description']] = (
-                    self.rewrite_stats.get(date_pattern['description'], 0) + 1
-                )
+                hits.append(index)
         
         # Additional fix: Handle any remaining date-like strings that might need casting
-        # Look for patterns like 'YYYY-MM-DD HH:MM:SS' that don't have explicit casting
-        remaining_datetime_pattern = r"'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'(?!::)"
-        statement = re.sub(
-            remaining_datetime_pattern,
-            r"'\1'::timestamp",
-            statement,
-            flags=re.IGNORECASE
-        )
-        
-        # Look for patterns like 'YYYY-MM-DD' that don't have explicit casting
-        remaining_date_pattern = r"'(\d{4}-\d{2}-\d{2})'(?!::)(?!\s+\d{2}:)"
-        statement = re.sub(
-            remaining_date_pattern,
-            r"'\1'::date",
-            statement,
-            flags=re.IGNORECASE
-        )
-        
-        # Handle edge case: dates that already have timestamp cast but wrong format
-        # Pattern: '12-07-2022 09:17:22'::timestamp -> '2022-07-12 09:17:22'::timestamp
-        existing_timestamp_pattern = r"'(\d{2})-(\d{2})-(\d{4}\s+\d{2}:\d{2}:\d{2})'::timestamp"
-        statement = re.sub(
-            existing_timestamp_pattern,
-            r"'\3-\2-\1'::timestamp",
-            statement,
-            flags=re.IGNORECASE
-        )
+        for rule in DATE_CAST_RULES:
+            statement = rule.compiled.sub(rule.substitution, statement)
         
         return statement
     
@@ -444,6 +905,11 @@ class SQLRewriter:
         """
         Rewrite an entire SQL file.
         
+        The source file is streamed statement by statement (see
+        _iter_file_statements) and rewritten statements are written out in
+        batches of REWRITE_BATCH_SIZE, so memory use does not grow with the
+        file size.
+        
         Args:
             source_file: Path to source SQL file
             target_file: Path to target SQL file
@@ -454,22 +920,21 @@ class SQLRewriter:
             True if successful, False otherwise
         """
         try:
-            # Read source file
-            with open(source_file, 'r', encoding=source_encoding) as f:
-                content = f.read()
-            
-            # Rewrite content
-            rewritten_content = self.rewrite_sql_content(content)
-            
-            # Convert encoding if needed
-            if source_encoding != target_encoding:
-                # The content is already in Unicode, just write with target encoding
-                pass
-            
-            # Write target file
             os.makedirs(os.path.dirname(target_file), exist_ok=True)
-            with open(target_file, 'w', encoding=target_encoding) as f:
-                f.write(rewritten_content)
+            
+            # The content is decoded to Unicode, so writing with the target
+            # encoding converts it
+            with open(target_file, 'w', encoding=target_encoding, buffering=READ_CHUNK_SIZE) as f:
+                statements = self._iter_file_statements(source_file, source_encoding)
+                first = True
+                while True:
+                    batch = self.rewrite_batch(islice(statements, REWRITE_BATCH_SIZE))
+                    if not batch:
+                        break
+                    if not first:
+                        f.write('\n')
+                    f.write('\n'.join(batch))
+                    first = False
             
             return True
             
@@ -477,6 +942,52 @@ class SQLRewriter:
             self.logger.error(f"Error rewriting SQL file {source_file}: {str(e)}")
             return False
     
+    def _iter_file_statements(self, source_file: str, source_encoding: str) -> Iterator[str]:
+        """
+        Iterate over the SQL statements of a file.
+        
+        Files in encodings that can be split on raw bytes are memory-mapped
+        and only one statement at a time is decoded. Other files are decoded
+        in chunks that are split with SQLStatementSplitter, which carries a
+        statement reaching the end of a chunk over to the next one.
+        
+        Args:
+            source_file: Path to source SQL file
+            source_encoding: Source file encoding
+            
+        Yields:
+            Non-empty, stripped SQL statements
+        """
+        if os.path.getsize(source_file) == 0:
+            return
+        
+        if not is_byte_splittable(source_encoding):
+            # Multi-byte encodings such as UTF-16 or GBK cannot be split on raw bytes
+            with open(source_file, 'r', encoding=source_encoding) as f:
+                splitter = SQLStatementSplitter()
+                while True:
+                    chunk = f.read(READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield from splitter.feed(chunk)
+                yield from splitter.close()
+            return
+        
+        fd = os.open(source_file, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                for match in SQL_STATEMENT_BYTES_PATTERN.finditer(mm):
+                    statement = match.group(0).decode(source_encoding)
+                    # Translate line endings like the text mode path does
+                    # (universal newlines), e.g. for Windows exports
+                    if '\r' in statement:
+                        statement = statement.replace('\r\n', '\n').replace('\r', '\n')
+                    statement = statement.strip()
+                    if statement:
+                        yield statement
+        finally:
+            os.close(fd)
+    
     def rewrite_sql_content(self, content: str) -> str:
         """
         Rewrite SQL content.
@@ -487,80 +998,243 @@ class SQLRewriter:
         Returns:
             Rewritten SQL content
         """
-        # Split content into statements
+        # Split content into statements and rewrite them
         statements = self._split_sql_statements(content)
         
-        # Rewrite each statement
-        rewritten_statements = []
-        for statement in statements:
-            if statement.strip():
-                if self._is_insert_statement(statement):
-                    rewritten = self.rewrite_insert_statement(statement)
-                else:
-                    # Apply general rules to non-INSERT statements
-                    rewritten = self._apply_general_rules(statement)
-                
-                rewritten_statements.append(rewritten)
-        
-        return '\n'.join(rewritten_statements)
+        return '\n'.join(self.rewrite_batch(statements))
     
-    def _split_sql_statements(self, content: str) -> List[str]:
-        """Split SQL content into individual statements."""
-        statements = []
-        current_statement = ""
-        in_string = False
-        escape_next = False
-        
-        for char in content:
-            if escape_next:
-                current_statement += char
-                escape_next = False
-                continue
-            
-            if char == '\\':
-                escape_next = True
-                current_statement += char
-                continue
-            
-            if char == "'" and not escape_next:
-                in_string = not in_string
-            
-            current_statement += char
+    def rewrite_batch(self, statements: Iterable[str]) -> List[str]:
+        """
+        Rewrite a batch of statements of any type.
+        
+        Equivalent to rewriting each statement on its own, but the per-call
+        lookups are done once for the whole batch.
+        
+        Args:
+            statements: Stripped, non-empty SQL statements
             
-            if char == ';' and not in_string:
-                if current_statement.strip():
-                    statements.append(current_statement.strip())
-                current_statement = ""
+        Returns:
+            Rewritten statements in the same order
+        """
+        is_insert = INSERT_STATEMENT_PATTERN.search
+        rewrite_insert = self.rewrite_insert_statement
+        apply_general_rules = self._apply_general_rules
+        
+        return [
+            rewrite_insert(statement) if is_insert(statement) else apply_general_rules(statement)
+            for statement in statements
+        ]
+    
+    def _rewrite_statement(self, statement: str) -> str:
+        """Rewrite a single statement of any type."""
+        if self._is_insert_statement(statement):
+            return self.rewrite_insert_statement(statement)
         
-        # Add remaining statement if any
-        if current_statement.strip():
-            statements.append(current_statement.strip())
+        # Apply general rules to non-INSERT statements
+        return self._apply_general_rules(statement)
+    
+    def _split_sql_statements(self, content: str) -> List[str]:
+        """
+        Split SQL content into individual statements.
         
-        return statements
+        A ';' outside of quoted strings ends a statement and a backslash
+        escapes the following character. The scan runs in the regex engine
+        instead of building each statement one character at a time; findall
+        returns the statement strings without creating match objects.
+        """
+        return [statement for statement in map(str.strip, SQL_STATEMENT_PATTERN.findall(content))
+                if statement]
     
     def _is_insert_statement(self, statement: str) -> bool:
         """Check if statement is an INSERT statement."""
         # Check if the statement contains an INSERT statement, even if it has comments
-        return re.search(r'^\s*INSERT\s+INTO', statement, re.IGNORECASE | re.MULTILINE) is not None
+        return INSERT_STATEMENT_PATTERN.search(statement) is not None
     
     def _apply_general_rules(self, statement: str) -> str:
         """Apply general rewrite rules to any statement."""
-        rewritten = statement
-        
         # Apply rules that are not INSERT-specific
-        general_rules = [rule for rule in self.rewrite_rules 
-                        if "INSERT" not in rule.description]
+        rule_hits = []
+        rewritten = self._apply_rule_plan(statement, self._general_rule_plan, rule_hits)
+        self._record_hits(rule_hits)
         
-        for rule in general_rules:
-            old_statement = rewritten
-            rewritten = re.sub(rule.pattern, rule.replacement, rewritten, flags=rule.flags)
+        return rewritten
+    
+    def _build_rule_plans(self) -> None:
+        """
+        Prepare the rewrite rules for application.
+        
+        Runs of consecutive literal rules (fixed replacement, no groups) with
+        the same flags are fused into a single alternation so the statement
+        is scanned once per run instead of once per rule. Rules keep their
+        relative order, so rules with backreferences still see the output of
+        the rules before them.
+        """
+        indexed_rules = list(enumerate(self.rewrite_rules))
+        self._insert_rule_plan = self._fuse_literal_rules(indexed_rules)
+        self._general_rule_plan = self._fuse_literal_rules(
+            [(index, rule) for index, rule in indexed_rules if "INSERT" not in rule.description]
+        )
+        
+        # Rules are only ever appended, so existing counts stay valid
+        self._rule_counts.extend([0] * (len(self.rewrite_rules) - len(self._rule_counts)))
+        self._rewrite_insert_cached.cache_clear()
+    
+    @staticmethod
+    def _fuse_literal_rules(indexed_rules: List[Tuple[int, RewriteRule]]
+                            ) -> List[Union[Tuple[int, RewriteRule], FusedRewriteRules]]:
+        """
+        Group consecutive literal rules into fused rules.
+        
+        Args:
+            indexed_rules: (index, rule) pairs in application order
             
-            # Track statistics
-            if old_statement != rewritten:
-                self.rewrite_stats[rule.description] = self.rewrite_stats.get(rule.description, 0) + 1
+        Returns:
+            (index, rule) pairs and fused rule runs in application order
+        """
+        plan = []
+        run = []
+        
+        for indexed_rule in indexed_rules + [None]:
+            rule = indexed_rule[1] if indexed_rule is not None else None
+            if rule is not None and rule.is_literal and (not run or run[0][1].flags == rule.flags):
+                run.append(indexed_rule)
+                continue
+            
+            if len(run) > 1:
+                plan.append(FusedRewriteRules.from_rules(run))
+            else:
+                plan.extend(run)
+            run = []
+            
+            if rule is not None:
+                if rule.is_literal:
+                    run.append(indexed_rule)
+                else:
+                    plan.append(indexed_rule)
+        
+        return plan
+    
+    def _apply_rule_plan(self, statement: str,
+                         plan: List[Union[Tuple[int, RewriteRule], FusedRewriteRules]],
+                         hits: List[int]) -> str:
+        """
+        Apply rewrite rules to a statement.
+        
+        Args:
+            statement: SQL statement
+            plan: Rules and fused rule runs from _build_rule_plans
+            hits: List to which the indices of rules that changed the
+                statement are added
+            
+        Returns:
+            Rewritten statement
+        """
+        rewritten = statement
+        lower = None
+        
+        for step in plan:
+            # Skip rules whose trigger word is missing, a plain substring
+            # search being much cheaper than a regex scan that finds nothing
+            if lower is None:
+                lower = fold_case(rewritten)
+                # Case folding rarely changes the length (e.g. 'İ'); only
+                # then can positions found in the folded text be reused
+                folded = lower if len(lower) == len(rewritten) else None
+            
+            if isinstance(step, FusedRewriteRules):
+                if step.triggers and not any(trigger in lower for trigger in step.triggers):
+                    continue
+                
+                if folded is not None:
+                    # Scanners start with a literal that is found much faster
+                    # than any match of the whole alternation, so the rules of
+                    # the run are applied one by one
+                    for index, rule in zip(step.indices, step.rules):
+                        if rule.trigger and rule.trigger not in lower:
+                            continue
+                        
+                        old_statement = rewritten
+                        rewritten = self._substitute(rule, rewritten, folded)
+                        
+                        # Track statistics
+                        if old_statement != rewritten:
+                            hits.append(index)
+                            lower = fold_case(rewritten)
+                            folded = lower if len(lower) == len(rewritten) else None
+                    continue
+                
+                matched = set()
+                
+                def replace(match, step=step, matched=matched):
+                    position = match.lastindex - 1
+                    matched.add(step.indices[position])
+                    return step.rules[position].replacement
+                
+                rewritten = step.compiled.sub(replace, rewritten)
+                
+                # Track statistics
+                hits.extend(matched)
+                if matched:
+                    lower = None
+            else:
+                index, rule = step
+                if rule.trigger and rule.trigger not in lower:
+                    continue
+                
+                old_statement = rewritten
+                rewritten = self._substitute(rule, rewritten, folded)
+                
+                # Track statistics
+                if old_statement != rewritten:
+                    hits.append(index)
+                    lower = None
         
         return rewritten
     
+    @staticmethod
+    def _substitute(rule: RewriteRule, statement: str, folded: Optional[str]) -> str:
+        """
+        Apply a rule, using its case-sensitive scanner on the folded statement
+        when possible.
+        
+        The scanner finds matches at the same positions as the rule's own
+        pattern. Literal rules splice in their fixed replacement; other rules
+        re-do each match on the original text to expand the replacement with
+        the original group contents, using the pre-parsed template if any.
+        
+        Args:
+            rule: Rewrite rule
+            statement: SQL statement
+            folded: fold_case(statement) if it has the same length, else None
+            
+        Returns:
+            Rewritten statement
+        """
+        if folded is None or rule.scanner is None:
+            return rule.compiled.sub(rule.substitution, statement)
+        
+        pieces = []
+        last_end = 0
+        
+        for match in rule.scanner.finditer(folded):
+            pieces.append(statement[last_end:match.start()])
+            if rule.is_literal:
+                pieces.append(rule.replacement)
+                last_end = match.end()
+            else:
+                original = rule.compiled.match(statement, match.start())
+                if rule.template is None:
+                    pieces.append(original.expand(rule.replacement))
+                else:
+                    pieces.append(rule.expand(original))
+                last_end = original.end()
+        
+        if not pieces:
+            return statement
+        
+        pieces.append(statement[last_end:])
+        return ''.join(pieces)
+    
     def add_custom_rule(self, pattern: str, replacement: str, description: str) -> None:
         """
         Add a custom rewrite rule.
@@ -576,32 +1250,96 @@ class SQLRewriter:
             description=description
         )
         self.rewrite_rules.append(rule)
+        self._build_rule_plans()
         self.logger.info(f"Added custom rewrite rule: {description}")
     
     def get_rewrite_statistics(self) -> Dict[str, int]:
         """Get rewrite statistics."""
-        return dict(self.rewrite_stats)
+        stats = dict(self.rewrite_stats)
+        
+        for rule, count in zip(self.rewrite_rules, self._rule_counts):
+            if count:
+                stats[rule.description] = stats.get(rule.description, 0) + count
+        
+        for rule, count in zip(DATE_FORMAT_RULES, self._date_rule_counts):
+            if count:
+                stats[rule.description] = stats.get(rule.description, 0) + count
+        
+        return stats
     
     def reset_statistics(self) -> None:
         """Reset rewrite statistics."""
         self.rewrite_stats.clear()
+        self._rule_counts = array('Q', [0]) * len(self.rewrite_rules)
+        self._date_rule_counts = array('Q', [0]) * len(DATE_FORMAT_RULES)
+
+
+class _RewriteWorkerConfig(NamedTuple):
+    """Configuration used to build a SQLRewriter in a worker process."""
+    source_db: str
+    target_db: str
+    target_schema: str
+    rewrite_rules: List[RewriteRule]
+
+
+# Rewriter of the current worker process, created by _init_rewrite_worker
+_worker_rewriter: Optional[SQLRewriter] = None
+
+
+def _init_rewrite_worker(worker_config: _RewriteWorkerConfig) -> None:
+    """Create the per-process SQLRewriter used by _rewrite_file_in_worker."""
+    global _worker_rewriter
+    
+    _worker_rewriter = SQLRewriter(
+        source_db=worker_config.source_db,
+        target_db=worker_config.target_db,
+        target_schema=worker_config.target_schema
+    )
+    # Keep custom rules added to the parent's rewriter
+    _worker_rewriter.rewrite_rules = worker_config.rewrite_rules
+    _worker_rewriter._build_rule_plans()
+
+
+def _rewrite_file_in_worker(source_file: str, target_file: str, source_encoding: str,
+                            target_encoding: str) -> Tuple[bool, Dict[str, int]]:
+    """Rewrite a single file in a process pool worker, returning its statistics."""
+    _worker_rewriter.reset_statistics()
+    success = _worker_rewriter.rewrite_sql_file(
+        source_file, target_file, source_encoding, target_encoding
+    )
+    return success, _worker_rewriter.get_rewrite_statistics()
 
 
 class BatchSQLRewriter:
     """Batch SQL file rewriter with encoding conversion."""
     
     def __init__(self, source_db: str, target_db: str, target_schema: str = "public",
-                 logger: Optional[Logger] = None):
-        """Initialize batch rewriter."""
+                 logger: Optional[Logger] = None, max_workers: Optional[int] = None):
+        """
+        Initialize batch rewriter.
+        
+        Args:
+            source_db: Source database name (Oracle)
+            target_db: Target database name (PostgreSQL)
+            target_schema: Target schema name
+            logger: Optional logger instance
+            max_workers: Maximum number of worker processes (defaults to the
+                CPU count, 1 rewrites files in this process)
+        """
         self.sql_rewriter = SQLRewriter(source_db, target_db, target_schema, logger)
         self.encoding_converter = EncodingConverter()
         self.logger = logger or Logger()
+        self.max_workers = max_workers or os.cpu_count() or 1
     
     def rewrite_files(self, file_mappings: List[Tuple[str, str, str]], 
                      target_encoding: str = 'utf-8') -> List[bool]:
         """
         Rewrite multiple SQL files.
         
+        Rewriting is CPU bound and files are independent, so several files
+        are rewritten in a process pool. Statistics of the workers are merged
+        into this rewriter's statistics.
+        
         Args:
             file_mappings: List of (source_file, target_file, source_encoding) tuples
             target_encoding: Target encoding for output files
@@ -609,23 +1347,66 @@ class BatchSQLRewriter:
         Returns:
             List of success flags for each file
         """
+        if len(file_mappings) <= 1 or self.max_workers == 1:
+            return [
+                self._rewrite_file(source_file, target_file, source_encoding, target_encoding)
+                for source_file, target_file, source_encoding in file_mappings
+            ]
+        
+        worker_config = _RewriteWorkerConfig(
+            source_db=self.sql_rewriter.source_db,
+            target_db=self.sql_rewriter.target_db,
+            target_schema=self.sql_rewriter.target_schema,
+            rewrite_rules=self.sql_rewriter.rewrite_rules
+        )
         results = []
         
-        for source_file, target_file, source_encoding in file_mappings:
-            self.logger.debug(f"Rewriting {source_file} -> {target_file}")
-            
-            success = self.sql_rewriter.rewrite_sql_file(
-                source_file, target_file, source_encoding, target_encoding
-            )
-            results.append(success)
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(file_mappings)),
+            initializer=_init_rewrite_worker,
+            initargs=(worker_config,)
+        ) as executor:
+            futures = [
+                executor.submit(_rewrite_file_in_worker, source_file, target_file,
+                                source_encoding, target_encoding)
+                for source_file, target_file, source_encoding in file_mappings
+            ]
             
-            if success:
-                self.logger.debug(f"✓ Successfully rewrote {source_file}")
-            else:
-                self.logger.error(f"✗ Failed to rewrite {source_file}")
+            for (source_file, target_file, _), future in zip(file_mappings, futures):
+                self.logger.debug(f"Rewriting {source_file} -> {target_file}")
+                
+                try:
+                    success, stats = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error rewriting SQL file {source_file}: {str(e)}")
+                    success, stats = False, {}
+                
+                self.sql_rewriter.rewrite_stats.update(stats)
+                
+                self._log_result(source_file, success)
+                results.append(success)
         
         return results
     
+    def _rewrite_file(self, source_file: str, target_file: str, source_encoding: str,
+                      target_encoding: str) -> bool:
+        """Rewrite a single file in this process."""
+        self.logger.debug(f"Rewriting {source_file} -> {target_file}")
+        
+        success = self.sql_rewriter.rewrite_sql_file(
+            source_file, target_file, source_encoding, target_encoding
+        )
+        self._log_result(source_file, success)
+        
+        return success
+    
+    def _log_result(self, source_file: str, success: bool) -> None:
+        """Log the outcome of rewriting a file."""
+        if success:
+            self.logger.debug(f"✓ Successfully rewrote {source_file}")
+        else:
+            self.logger.error(f"✗ Failed to rewrite {source_file}")
+    
     def get_combined_statistics(self) -> Dict[str, any]:
         """Get combined rewrite statistics."""
         rewrite_stats = self.sql_rewriter.get_rewrite_statistics()
@@ -682,6 +1463,28 @@ class PostgreSQLCompatibilityChecker:
                 'suggestion': 'Review date/number formatting functions'
             }
         ]
+        
+        # All checks in one alternation, so the content is scanned once. The
+        # patterns never match overlapping text, so no issue is hidden.
+        self._scanner = re.compile(
+            '|'.join(f"(?P<check{i}>{check['pattern']})"
+                     for i, check in enumerate(self.compatibility_checks)),
+            re.IGNORECASE
+        )
+        
+        # Hyperscan matches all checks in one SIMD pass when available. It
+        # works on bytes with ASCII semantics, so it only scans ASCII content;
+        # \s is widened to the ASCII separators Python also treats as space.
+        self._hyperscan_db = None
+        if hyperscan is not None:
+            self._hyperscan_db = hyperscan.Database()
+            self._hyperscan_db.compile(
+                expressions=[check['pattern'].replace(r'\s', r'[\s\x1c-\x1f]').encode()
+                             for check in self.compatibility_checks],
+                ids=list(range(len(self.compatibility_checks))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+                * len(self.compatibility_checks)
+            )
     
     def check_compatibility(self, sql_content: str) -> List[Dict[str, any]]:
         """
@@ -693,24 +1496,45 @@ class PostgreSQLCompatibilityChecker:
         Returns:
             List of compatibility issues found
         """
-        issues = []
-        
-        for check in self.compatibility_checks:
-            matches = re.finditer(check['pattern'], sql_content, re.IGNORECASE)
+        if self._hyperscan_db is not None and sql_content.isascii():
+            matches = self._scan_with_hyperscan(sql_content)
+        else:
+            matches = ((int(match.lastgroup[len('check'):]), match.start(), match.end())
+                       for match in self._scanner.finditer(sql_content))
+        
+        found = []
+        line_num = 1
+        line_pos = 0
+        
+        for check_index, start, end in matches:
+            # Find line number, counting only the newlines since the last match
+            line_num += sql_content.count('\n', line_pos, start)
+            line_pos = start
             
-            for match in matches:
-                # Find line number
-                line_num = sql_content[:match.start()].count('\n') + 1
-                
-                issues.append({
-                    'line': line_num,
-                    'position': match.start(),
-                    'matched_text': match.group(0),
-                    'issue': check['issue'],
-                    'suggestion': check['suggestion']
-                })
-        
-        return issues
+            check = self.compatibility_checks[check_index]
+            found.append((check_index, {
+                'line': line_num,
+                'position': start,
+                'matched_text': sql_content[start:end],
+                'issue': check['issue'],
+                'suggestion': check['suggestion']
+            }))
+        
+        # Report issues grouped by check, in content order within each check
+        found.sort(key=lambda item: item[0])
+        return [issue for _, issue in found]
+    
+    def _scan_with_hyperscan(self, sql_content: str) -> List[Tuple[int, int, int]]:
+        """Find (check index, start, end) of all issues in ASCII content with hyperscan."""
+        matches = []
+        
+        def on_match(check_index: int, start: int, end: int, flags: int, context) -> None:
+            matches.append((check_index, start, end))
+        
+        self._hyperscan_db.scan(sql_content.encode('ascii'), match_event_handler=on_match)
+        # Hyperscan reports matches by end offset
+        matches.sort(key=lambda item: item[1])
+        return matches
     
     def generate_compatibility_report(self, issues: List[Dict[str, any]]) -> str:
         """Generate a compatibility report."""
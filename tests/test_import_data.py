@@ -38,6 +38,22 @@ class TestDataImporter:
         self.config.target_encoding = "utf-8"
         self.config.output_dir = "/test/output"
     
+    @pytest.fixture
+    def importer(self):
+        """Provide a DataImporter with its database and import components mocked."""
+        from import_data import DataImporter
+        
+        with patch('import_data.DatabaseManager'), \
+                patch('import_data.SQLRewriter'), \
+                patch('import_data.ParallelImporter'), \
+                patch('import_data.DataImporter._init_database_manager'), \
+                patch('import_data.DataImporter._init_parallel_importer'):
+            importer = DataImporter(self.config)
+            # Set the attributes that would be set by the mocked methods
+            importer.db_manager = Mock()
+            importer.parallel_importer = Mock()
+            yield importer
+    
     @patch('import_data.DatabaseManager')
     @patch('import_data.SQLRewriter')
     @patch('import_data.ParallelImporter')
@@ -60,62 +76,78 @@ class TestDataImporter:
         mock_sql_rewriter.assert_called_once()
         mock_parallel_importer.assert_called_once()
     
-    def test_load_encoding_report_file_exists(self):
-        """Test loading encoding report when file exists."""
+    @patch('import_data.DatabaseManager')
+    @patch('import_data.SQLRewriter')
+    @patch('import_data.ParallelImporter')
+    def test_parallel_importer_uses_threads_by_default(self, mock_parallel_importer, mock_sql_rewriter, mock_db_manager):
+        """Test the traditional importer only uses worker processes when enabled."""
         from import_data import DataImporter
         
-        # Create temporary encoding report
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['file_path', 'encoding', 'confidence'])
-            writer.writerow(['/test/file1.sql', 'utf-8', '0.99'])
-            writer.writerow(['/test/file2.sql', 'gbk', '0.95'])
-            temp_file = f.name
-        
-        try:
-            # Mock the config to point to our temp file
-            with patch.object(self.config, 'output_dir', os.path.dirname(temp_file)):
-                with patch('os.path.join', return_value=temp_file):
-                    with patch('import_data.DatabaseManager'):
-                        with patch('import_data.SQLRewriter'):
-                            with patch('import_data.ParallelImporter'):
-                                # Mock database connection test
-                                with patch('import_data.DataImporter._init_database_manager'):
-                                    with patch('import_data.DataImporter._init_parallel_importer'):
-                                        importer = DataImporter(self.config)
-                                        # Manually set the attributes that would be set by the mocked methods
-                                        importer.db_manager = Mock()
-                                        importer.parallel_importer = Mock()
-                                    encoding_map = importer.load_encoding_report()
-            
-            assert len(encoding_map) == 2
-            assert encoding_map['/test/file1.sql'] == 'utf-8'
-            assert encoding_map['/test/file2.sql'] == 'gbk'
+        self.config.performance.use_streaming = False
+        DataImporter(self.config)
+        assert mock_parallel_importer.call_args.kwargs['use_multiprocessing'] is False
         
-        finally:
-            os.unlink(temp_file)
+        self.config.performance.use_process_pool = True
+        DataImporter(self.config)
+        assert mock_parallel_importer.call_args.kwargs['use_multiprocessing'] is True
+    
+    def test_load_encoding_report_file_exists(self, importer, tmp_path):
+        """Test loading encoding report when file exists."""
+        # Create temporary encoding report
+        csv_file = tmp_path / "encoding_report.csv"
+        csv_file.write_text(
+            "file_path,encoding,confidence\n"
+            "/test/file1.sql,utf-8,0.99\n"
+            "/test/file2.sql,gbk,0.95\n",
+            encoding='utf-8'
+        )
+        
+        # Mock the config to point to our temp file
+        with patch.object(self.config, 'output_dir', str(tmp_path)):
+            with patch('os.path.join', return_value=str(csv_file)):
+                encoding_map = importer.load_encoding_report()
+        
+        assert len(encoding_map) == 2
+        assert encoding_map['/test/file1.sql'] == 'utf-8'
+        assert encoding_map['/test/file2.sql'] == 'gbk'
     
-    def test_load_encoding_report_file_not_exists(self):
+    def test_load_encoding_report_from_reports_dir(self, importer, tmp_path, monkeypatch):
+        """Test loading the latest encoding report from the reports directory."""
+        reports_dir = tmp_path / "reports"
+        reports_dir.mkdir()
+        (reports_dir / "encoding_analysis_20240101.csv").write_text(
+            "file_path,encoding,confidence\n"
+            "/test/file1.sql,latin-1,0.5\n",
+            encoding='utf-8'
+        )
+        (reports_dir / "encoding_analysis_20240102.csv").write_text(
+            "file_path,file_name,encoding,confidence\r\n"
+            "/test/file1.sql,file1.sql,utf-8,0.99\r\n"
+            "/test/file2.sql,file2.sql,gbk,0.95\r\n",
+            encoding='utf-8'
+        )
+        monkeypatch.chdir(tmp_path)
+        
+        encoding_map = importer.load_encoding_report()
+        
+        assert encoding_map == {
+            '/test/file1.sql': 'utf-8',
+            'file1.sql': 'utf-8',
+            '/test/file2.sql': 'gbk',
+            'file2.sql': 'gbk'
+        }
+    
+    def test_load_encoding_report_file_not_exists(self, importer):
         """Test loading encoding report when file doesn't exist."""
-        from import_data import DataImporter
-        
-        with patch('import_data.DatabaseManager'):
-            with patch('import_data.SQLRewriter'):
-                with patch('import_data.ParallelImporter'):
-                    with patch('import_data.DataImporter._init_database_manager'):
-                        with patch('import_data.DataImporter._init_parallel_importer'):
-                            importer = DataImporter(self.config)
-                            importer.db_manager = Mock()
-                            importer.parallel_importer = Mock()
-                            encoding_map = importer.load_encoding_report()
+        encoding_map = importer.load_encoding_report()
         
         assert encoding_map == {}
     
     @patch('import_data.Path')
-    def test_discover_sql_files(self, mock_path):
+    def test_discover_sql_files(self, mock_path, importer, tmp_path, monkeypatch):
         """Test SQL file discovery."""
-        from import_data import DataImporter
-        
+        # Keep the SQL file index out of the working tree
+        monkeypatch.chdir(tmp_path)
         # Mock Path behavior
         mock_source_dir = Mock()
         mock_source_dir.exists.return_value = True
@@ -135,39 +167,73 @@ class TestDataImporter:
         mock_source_dir.rglob.return_value = [mock_file1, mock_file2, mock_dir]
         mock_path.return_value = mock_source_dir
         
-        with patch('import_data.DatabaseManager'):
-            with patch('import_data.SQLRewriter'):
-                with patch('import_data.ParallelImporter'):
-                    with patch('import_data.DataImporter._init_database_manager'):
-                        with patch('import_data.DataImporter._init_parallel_importer'):
-                            importer = DataImporter(self.config)
-                            importer.db_manager = Mock()
-                            importer.parallel_importer = Mock()
-                            sql_files = importer.discover_sql_files()
+        sql_files = importer.discover_sql_files()
         
         assert len(sql_files) == 2
         assert '/test/file1.sql' in sql_files
         assert '/test/file2.sql' in sql_files
     
-    def test_create_import_tasks(self):
-        """Test creation of import tasks."""
-        from import_data import DataImporter
+    def test_discover_sql_files_uses_index(self, importer, tmp_path, monkeypatch):
+        """Test SQL file discovery reuses the index until the source tree changes."""
+        from pathlib import Path
+        
+        source_dir = tmp_path / "source"
+        (source_dir / "nested").mkdir(parents=True)
+        (source_dir / "empty").mkdir()
+        (source_dir / "users.sql").write_text("SELECT 1;")
+        (source_dir / "nested" / "orders.sql").write_text("SELECT 1;")
+        monkeypatch.chdir(tmp_path)
+        importer.config.source_directory = str(source_dir)
+        
+        sql_files = importer.discover_sql_files()
+        
+        assert sql_files == [
+            str(source_dir / "nested" / "orders.sql"),
+            str(source_dir / "users.sql")
+        ]
+        assert (tmp_path / "reports" / "sql_files.index").exists()
+        
+        # Unchanged tree: served from the index without walking the directory
+        with patch.object(Path, 'rglob', side_effect=AssertionError("rglob called")):
+            assert importer.discover_sql_files() == sql_files
+        
+        # A new file in a nested directory invalidates the index
+        (source_dir / "nested" / "products.sql").write_text("SELECT 1;")
+        os.utime(source_dir / "nested", ns=(0, 0))
+        
+        assert importer.discover_sql_files() == [
+            str(source_dir / "nested" / "orders.sql"),
+            str(source_dir / "nested" / "products.sql"),
+            str(source_dir / "users.sql")
+        ]
         
+        # So does a file in a directory that had no SQL files when indexed
+        (source_dir / "empty" / "customers.sql").write_text("SELECT 1;")
+        os.utime(source_dir / "empty", ns=(0, 0))
+        
+        assert importer.discover_sql_files() == [
+            str(source_dir / "empty" / "customers.sql"),
+            str(source_dir / "nested" / "orders.sql"),
+            str(source_dir / "nested" / "products.sql"),
+            str(source_dir / "users.sql")
+        ]
+        
+        # An index recording no directories is never trusted
+        index_file = str(tmp_path / "reports" / "sql_files.index")
+        with open(index_file, 'w', encoding='utf-8') as f:
+            f.write(f"{source_dir}\n0\n{source_dir / 'users.sql'}\n")
+        
+        assert importer._load_sql_files_index(index_file, str(source_dir)) is None
+    
+    def test_create_import_tasks(self, importer):
+        """Test creation of import tasks."""
         sql_files = ['/test/users.sql', '/test/orders_data.sql', '/test/insert_products.sql']
         encoding_map = {
             '/test/users.sql': 'utf-8',
             '/test/orders_data.sql': 'gbk'
         }
         
-        with patch('import_data.DatabaseManager'):
-            with patch('import_data.SQLRewriter'):
-                with patch('import_data.ParallelImporter'):
-                    with patch('import_data.DataImporter._init_database_manager'):
-                        with patch('import_data.DataImporter._init_parallel_importer'):
-                            importer = DataImporter(self.config)
-                            importer.db_manager = Mock()
-                            importer.parallel_importer = Mock()
-                            tasks = importer.create_import_tasks(sql_files, encoding_map)
+        tasks = importer.create_import_tasks(sql_files, encoding_map)
         
         assert len(tasks) == 3
         
@@ -187,10 +253,8 @@ class TestDataImporter:
         assert tasks[2].encoding == 'utf-8'  # default encoding
     
     @patch('import_data.time.time')
-    def test_import_data_success(self, mock_time):
+    def test_import_data_success(self, mock_time, importer):
         """Test successful data import."""
-        from import_data import DataImporter
-        
         # Mock time - return a constant value to avoid StopIteration
         mock_time.return_value = 1000
         
@@ -214,25 +278,14 @@ class TestDataImporter:
             )
         ]
         
-        with patch('import_data.DatabaseManager'):
-            with patch('import_data.SQLRewriter'):
-                with patch('import_data.ParallelImporter') as mock_parallel:
-                    with patch('import_data.DataImporter._init_database_manager'):
-                        # Mock parallel importer
-                        mock_parallel_instance = Mock()
-                        mock_parallel_instance.import_files.return_value = mock_results
-                        mock_parallel.return_value = mock_parallel_instance
-                        
-                        with patch('import_data.DataImporter._init_parallel_importer'):
-                            importer = DataImporter(self.config)
-                            importer.db_manager = Mock()
-                            importer.parallel_importer = mock_parallel_instance
-                            
-                            # Mock other methods
-                            importer.load_encoding_report = Mock(return_value={})
-                            importer.discover_sql_files = Mock(return_value=['/test/file1.sql', '/test/file2.sql'])
-                            
-                            results = importer.import_data()
+        # Mock parallel importer
+        importer.parallel_importer.import_files.return_value = mock_results
+        
+        # Mock other methods
+        importer.load_encoding_report = Mock(return_value={})
+        importer.discover_sql_files = Mock(return_value=['/test/file1.sql', '/test/file2.sql'])
+        
+        results = importer.import_data()
         
         assert len(results) == 2
         assert importer.import_stats['total_files'] == 2
@@ -242,10 +295,8 @@ class TestDataImporter:
         assert importer.import_stats['failed_records'] == 5
         assert importer.import_stats['total_time'] == 0  # Since we used constant time
     
-    def test_generate_import_report(self):
+    def test_generate_import_report(self, importer):
         """Test import report generation."""
-        from import_data import DataImporter
-        
         # Create mock results
         results = [
             ImportResult(
@@ -271,25 +322,17 @@ class TestDataImporter:
         with tempfile.TemporaryDirectory() as temp_dir:
             self.config.output_dir = temp_dir
             
-            with patch('import_data.DatabaseManager'):
-                with patch('import_data.SQLRewriter'):
-                    with patch('import_data.ParallelImporter'):
-                        with patch('import_data.DataImporter._init_database_manager'):
-                            with patch('import_data.DataImporter._init_parallel_importer'):
-                                importer = DataImporter(self.config)
-                                importer.db_manager = Mock()
-                                importer.parallel_importer = Mock()
-                                importer.import_stats = {
-                                'total_files': 2,
-                                'successful_files': 1,
-                                'failed_files': 1,
-                                'total_records': 160,
-                                'successful_records': 150,
-                                'failed_records': 10,
-                                'total_time': 3.0
-                            }
-                            
-                            report_file = importer.generate_import_report(results)
+            importer.import_stats = {
+                'total_files': 2,
+                'successful_files': 1,
+                'failed_files': 1,
+                'total_records': 160,
+                'successful_records': 150,
+                'failed_records': 10,
+                'total_time': 3.0
+            }
+            
+            report_file = importer.generate_import_report(results)
             
             # Check that report files were created
             assert os.path.exists(report_file)
@@ -322,17 +365,16 @@ class TestCommandLineInterface:
     
     def test_argument_parser_creation(self):
         """Test argument parser creation."""
-        from import_data import create_argument_parser
-        
-        parser = create_argument_parser()
+        from import_data import CliArgs, parse_arguments
         
         # Test with minimal required arguments
-        args = parser.parse_args([
+        args = parse_arguments([
             '--source-dir', '/test/source',
             '--target-db', 'testdb',
             '--db-password', 'secret'
         ])
         
+        assert isinstance(args, CliArgs)
         assert args.source_dir == '/test/source'
         assert args.target_db == 'testdb'
         assert args.db_password == 'secret'
@@ -341,11 +383,9 @@ class TestCommandLineInterface:
     
     def test_argument_parser_all_options(self):
         """Test argument parser with all options."""
-        from import_data import create_argument_parser
-        
-        parser = create_argument_parser()
+        from import_data import CliArgs, parse_arguments
         
-        args = parser.parse_args([
+        args = parse_arguments([
             '--config', 'config.yaml',
             '--source-dir', '/data/sql',
             '--target-db', 'mydb',
@@ -357,6 +397,7 @@ class TestCommandLineInterface:
             '--db-password', 'secret123',
             '--max-workers', '8',
             '--batch-size', '2000',
+            '--use-copy',
             '--default-encoding', 'gbk',
             '--target-encoding', 'utf-8',
             '--output-dir', '/reports',
@@ -375,11 +416,14 @@ class TestCommandLineInterface:
         assert args.db_password == 'secret123'
         assert args.max_workers == 8
         assert args.batch_size == 2000
+        assert args.use_copy is True
         assert args.default_encoding == 'gbk'
         assert args.target_encoding == 'utf-8'
         assert args.output_dir == '/reports'
         assert args.log_level == 'DEBUG'
         assert args.verbose is True
+        assert isinstance(args, CliArgs)
+        assert not hasattr(args, '__dict__')
 
 
 if __name__ == '__main__':
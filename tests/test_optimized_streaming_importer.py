@@ -0,0 +1,93 @@
+"""
+Tests for optimized streaming importer.
+"""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from oracle_to_postgres.common.config import Config
+from oracle_to_postgres.common.database import DatabaseManager, ConnectionInfo
+from oracle_to_postgres.common.optimized_streaming_importer import (
+    OptimizedStreamingImporter, _WorkerConfig, _get_worker_rewriter
+)
+from oracle_to_postgres.common.sql_rewriter import SQLRewriter
+
+
+class TestWorkerConfig:
+    """Test configuration passed to worker processes."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.config = Config()
+        self.config.source_db = "oracle_db"
+        self.config.target_db = "test_db"
+        self.config.target_schema = "public"
+        self.config.db_host = "localhost"
+        self.config.db_port = 5432
+        self.config.db_user = "postgres"
+        self.config.db_password = "password"
+
+        self.mock_db_manager = Mock(spec=DatabaseManager)
+        self.mock_db_manager.connection_info = ConnectionInfo(
+            host=self.config.db_host,
+            port=self.config.db_port,
+            database=self.config.target_db,
+            username=self.config.db_user,
+            password=self.config.db_password,
+            schema=self.config.target_schema
+        )
+        self.sql_rewriter = SQLRewriter(
+            source_db=self.config.source_db,
+            target_db=self.config.target_db,
+            target_schema=self.config.target_schema
+        )
+
+    def test_worker_config_from_importer(self):
+        """Test worker configuration is derived from importer components."""
+        importer = OptimizedStreamingImporter(
+            db_manager=self.mock_db_manager,
+            sql_rewriter=self.sql_rewriter,
+            use_multiprocessing=False
+        )
+
+        assert importer._wcfg == _WorkerConfig(
+            host="localhost",
+            port=5432,
+            database="test_db",
+            username="postgres",
+            password="password",
+            schema="public",
+            source_db="oracle_db",
+            target_db="test_db",
+            target_schema="public"
+        )
+        assert pickle.loads(pickle.dumps(importer._wcfg)) == importer._wcfg
+
+    def test_worker_config_pickles_smaller_than_config(self):
+        """Test worker configuration is cheaper to send to workers than Config."""
+        importer = OptimizedStreamingImporter(
+            db_manager=self.mock_db_manager,
+            sql_rewriter=self.sql_rewriter,
+            use_multiprocessing=False
+        )
+
+        assert len(pickle.dumps(importer._wcfg)) < len(pickle.dumps(self.config))
+    
+    def test_worker_rewriter_is_reused(self):
+        """Test workers create one SQLRewriter for all chunks, not shared between threads."""
+        rewriter = _get_worker_rewriter("oracle_db", "test_db", "public")
+        
+        assert isinstance(rewriter, SQLRewriter)
+        assert _get_worker_rewriter("oracle_db", "test_db", "public") is rewriter
+        assert _get_worker_rewriter("oracle_db", "test_db", "other") is not rewriter
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            thread_rewriter = executor.submit(_get_worker_rewriter, "oracle_db", "test_db", "public").result()
+        assert thread_rewriter is not rewriter
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
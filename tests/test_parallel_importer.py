@@ -3,17 +3,23 @@ Tests for parallel data importer.
 """
 
 import os
+import sys
+import logging
 import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 
+from oracle_to_postgres.common import parallel_importer
 from oracle_to_postgres.common.parallel_importer import (
     ImportTask, ImportResult, ImportProgress, ImportProgressMonitor,
-    SingleFileImporter, ParallelImporter
+    SingleFileImporter, ParallelImporter, parse_literal_rows
 )
 from oracle_to_postgres.common.database import DatabaseManager, ConnectionInfo
+from oracle_to_postgres.common import sql_rewriter
 from oracle_to_postgres.common.sql_rewriter import SQLRewriter
 from oracle_to_postgres.common.logger import Logger
 
@@ -56,7 +62,7 @@ class TestImportResult:
         assert result.records_failed == 5
         assert result.processing_time == 2.5
         assert result.error_message is None
-        assert result.warnings == []
+        assert result.warnings == ()
     
     def test_import_result_with_warnings(self):
         """Test ImportResult with warnings."""
@@ -72,8 +78,36 @@ class TestImportResult:
             warnings=warnings
         )
         
-        assert result.warnings == warnings
+        assert result.warnings == ("Warning 1", "Warning 2")
         assert result.error_message == "Some error"
+        
+        # The result does not share the caller's list
+        warnings.append("Warning 3")
+        assert result.warnings == ("Warning 1", "Warning 2")
+    
+    def test_import_result_is_frozen(self):
+        """Test ImportResult fields cannot be reassigned."""
+        result = ImportResult(
+            file_path="/path/to/file.sql",
+            table_name="test_table",
+            success=True,
+            records_processed=100,
+            records_failed=0,
+            processing_time=1.0
+        )
+        
+        with pytest.raises(FrozenInstanceError):
+            result.success = False
+        
+        assert hash(result) == hash(ImportResult(
+            file_path="/path/to/file.sql",
+            table_name="test_table",
+            success=True,
+            records_processed=100,
+            records_failed=0,
+            processing_time=1.0,
+            warnings=[]
+        ))
 
 
 class TestImportProgress:
@@ -209,6 +243,55 @@ class TestImportProgressMonitor:
         # Should have processed 10 files total
         final_progress = monitor.get_progress()
         assert final_progress.completed_files == 10
+    
+    def test_callbacks_run_outside_lock(self):
+        """Test that callbacks get a snapshot and may call back into the monitor."""
+        monitor = ImportProgressMonitor()
+        snapshots = []
+        
+        def reentrant_callback(progress):
+            # Would deadlock if callbacks ran while the lock is held
+            snapshots.append((progress, monitor.get_progress()))
+        
+        monitor.add_progress_callback(reentrant_callback)
+        monitor.start_monitoring(2)
+        
+        result = ImportResult(
+            file_path="/test.sql",
+            table_name="test_table",
+            success=True,
+            records_processed=10,
+            records_failed=0,
+            processing_time=1.0
+        )
+        monitor.update_file_completed(result)
+        monitor.update_file_completed(result)
+        
+        assert [progress.completed_files for progress, _ in snapshots] == [1, 2]
+        assert snapshots[0][1].completed_files == 1
+
+
+class TestParseLiteralRows:
+    """Test parsing of VALUES lists for COPY."""
+    
+    def test_parse_literal_values(self):
+        """Test parsing strings, numbers, NULL and date casts."""
+        rows = parse_literal_rows("(1, 'it''s', NULL, -2.5e3, '2023-01-01'::date)")
+        
+        assert rows == [['1', "it's", '\\N', '-2.5e3', '2023-01-01']]
+    
+    def test_parse_multiple_rows(self):
+        """Test parsing a multi-row VALUES list."""
+        rows = parse_literal_rows("(1, 'a'), (2, 'b, c')")
+        
+        assert rows == [['1', 'a'], ['2', 'b, c']]
+    
+    def test_parse_non_literal_values(self):
+        """Test that expressions are rejected."""
+        assert parse_literal_rows("(1, NOW())") is None
+        assert parse_literal_rows("(nextval('seq'), 'a')") is None
+        assert parse_literal_rows("(1, 'a') RETURNING id") is None
+        assert parse_literal_rows("(1, '\\N')") is None
 
 
 class TestSingleFileImporter:
@@ -216,9 +299,9 @@ class TestSingleFileImporter:
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.mock_db_manager = Mock(spec=DatabaseManager)
-        self.mock_sql_rewriter = Mock(spec=SQLRewriter)
-        self.mock_logger = Mock(spec=Logger)
+        self.mock_db_manager = Mock(spec_set=DatabaseManager)
+        self.mock_sql_rewriter = Mock(spec_set=SQLRewriter)
+        self.mock_logger = Mock(spec_set=Logger)
         
         self.importer = SingleFileImporter(
             db_manager=self.mock_db_manager,
@@ -227,6 +310,16 @@ class TestSingleFileImporter:
             logger=self.mock_logger
         )
     
+    def _mock_connection(self):
+        """Make the mocked database manager hand out a mocked connection and cursor."""
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        
+        mock_context_manager = MagicMock()
+        mock_context_manager.__enter__.return_value = mock_conn
+        self.mock_db_manager.get_connection.return_value = mock_context_manager
+        return mock_conn, mock_cursor
+    
     def test_split_sql_statements(self):
         """Test SQL statement splitting."""
         content = """
@@ -242,54 +335,132 @@ class TestSingleFileImporter:
         assert "INSERT INTO table2" in statements[1]
         assert "test''s value" in statements[2]
     
+    def test_split_sql_statements_with_escapes(self):
+        """Test that quoted and escaped semicolons do not end a statement."""
+        content = "INSERT INTO t VALUES ('a;b');INSERT INTO t VALUES ('it\\'s; ok');\nINSERT INTO t VALUES (3)"
+        
+        statements = self.importer._split_sql_statements(content)
+        
+        assert statements == [
+            "INSERT INTO t VALUES ('a;b');",
+            "INSERT INTO t VALUES ('it\\'s; ok');",
+            "INSERT INTO t VALUES (3)"
+        ]
+    
     def test_execute_batch_success(self):
         """Test successful batch execution."""
         # Mock database connection
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        
-        # Mock the context manager properly
-        mock_context_manager = MagicMock()
-        mock_context_manager.__enter__.return_value = mock_conn
-        mock_context_manager.__exit__.return_value = None
-        self.mock_db_manager.get_connection.return_value = mock_context_manager
+        mock_conn, mock_cursor = self._mock_connection()
         
         statements = ["INSERT INTO test VALUES (1);", "INSERT INTO test VALUES (2);"]
         
-        result = self.importer._execute_batch(statements)
+        with patch('oracle_to_postgres.common.parallel_importer.execute_values') as mock_execute_values:
+            result = self.importer._execute_batch(statements)
         
         assert result['processed'] == 2
         assert result['failed'] == 0
         assert len(result['warnings']) == 0
-        assert mock_cursor.execute.call_count == 2
+        mock_execute_values.assert_called_once()
+        assert mock_cursor.execute.call_count == 0
         mock_conn.commit.assert_called_once()
     
     def test_execute_batch_with_failures(self):
         """Test batch execution with some failures."""
         # Mock database connection
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        
-        # Mock the context manager properly
-        mock_context_manager = MagicMock()
-        mock_context_manager.__enter__.return_value = mock_conn
-        mock_context_manager.__exit__.return_value = None
-        self.mock_db_manager.get_connection.return_value = mock_context_manager
+        mock_conn, mock_cursor = self._mock_connection()
         
         # Make second statement fail
-        mock_cursor.execute.side_effect = [None, Exception("SQL error"), None]
+        def execute(sql, params=None):
+            if sql == "INVALID SQL;":
+                raise Exception("SQL error")
+        mock_cursor.execute.side_effect = execute
         
         statements = ["INSERT INTO test VALUES (1);", "INVALID SQL;", "INSERT INTO test VALUES (3);"]
         
-        result = self.importer._execute_batch(statements)
+        # Batched INSERTs fail as well, forcing the row-by-row fallback
+        with patch('oracle_to_postgres.common.parallel_importer.execute_values',
+                   side_effect=Exception("Batch error")):
+            result = self.importer._execute_batch(statements)
         
         assert result['processed'] == 2
         assert result['failed'] == 1
         assert len(result['warnings']) == 1
         assert "Failed to execute statement" in result['warnings'][0]
     
+    def test_execute_batch_buckets_by_table(self):
+        """Test that interleaved INSERTs are bucketed per table between barriers."""
+        mock_conn, mock_cursor = self._mock_connection()
+        
+        statements = [
+            "INSERT INTO a VALUES (1);",
+            "INSERT INTO b VALUES (1);",
+            "INSERT INTO a VALUES (2);",
+            "DELETE FROM a WHERE id = 3;",
+            "INSERT INTO a VALUES (3);"
+        ]
+        
+        with patch('oracle_to_postgres.common.parallel_importer.execute_values') as mock_execute_values:
+            result = self.importer._execute_batch(statements)
+        
+        assert result['processed'] == 5
+        assert result['failed'] == 0
+        calls = [(c[0][1], [str(row[0]) for row in c[0][2]])
+                 for c in mock_execute_values.call_args_list]
+        assert calls == [
+            ("INSERT INTO a VALUES %s", ["(1)", "(2)"]),
+            ("INSERT INTO b VALUES %s", ["(1)"]),
+            ("INSERT INTO a VALUES %s", ["(3)"])
+        ]
+        mock_cursor.execute.assert_called_once_with("DELETE FROM a WHERE id = 3;")
+    
+    def test_execute_batch_retries_only_failing_page(self):
+        """Test that only the failing execute_values page is split up and retried."""
+        mock_conn, mock_cursor = self._mock_connection()
+        
+        # Second row of the second page fails
+        mock_cursor.execute.side_effect = [None, Exception("SQL error")]
+        
+        with patch('oracle_to_postgres.common.parallel_importer.execute_values',
+                   side_effect=[None, Exception("Batch error")]) as mock_execute_values:
+            result = self.importer._execute_batch(
+                [f"INSERT INTO test VALUES ({i});" for i in range(4)]
+            )
+        
+        # batch_size=2 -> two pages, only the second one is split into rows
+        assert mock_execute_values.call_count == 2
+        assert [c[0][0] for c in mock_cursor.execute.call_args_list] == [
+            "INSERT INTO test VALUES (2);", "INSERT INTO test VALUES (3);"
+        ]
+        assert result['processed'] == 3
+        assert result['failed'] == 1
+        assert result['warnings'] == ["Failed to execute statement: SQL error..."]
+    
+    def test_execute_batch_bisects_failing_page(self):
+        """Test that a bad row is found in a logarithmic number of round trips."""
+        self.importer.batch_size = 1000
+        mock_conn, mock_cursor = self._mock_connection()
+        
+        def execute_values(cursor, sql, rows, **kwargs):
+            if any(str(row[0]) == "(617)" for row in rows):
+                raise Exception("SQL error")
+        
+        def execute(statement):
+            if "(617)" in statement:
+                raise Exception("SQL error")
+        mock_cursor.execute.side_effect = execute
+        
+        with patch('oracle_to_postgres.common.parallel_importer.execute_values',
+                   side_effect=execute_values) as mock_execute_values:
+            result = self.importer._execute_batch(
+                [f"INSERT INTO test VALUES ({i});" for i in range(1000)]
+            )
+        
+        assert result['processed'] == 999
+        assert result['failed'] == 1
+        assert len(result['warnings']) == 1
+        # One attempt for the page plus two per halving, instead of 1000 rows
+        assert mock_execute_values.call_count + mock_cursor.execute.call_count <= 1 + 2 * 10
+    
     def test_import_file_success(self):
         """Test successful file import."""
         # Create temporary SQL file
@@ -301,15 +472,7 @@ class TestSingleFileImporter:
             # Mock dependencies
             self.mock_sql_rewriter.rewrite_insert_statement.side_effect = lambda x: x
             
-            mock_conn = MagicMock()
-            mock_cursor = MagicMock()
-            mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-            
-            # Mock the context manager properly
-            mock_context_manager = MagicMock()
-            mock_context_manager.__enter__.return_value = mock_conn
-            mock_context_manager.__exit__.return_value = None
-            self.mock_db_manager.get_connection.return_value = mock_context_manager
+            mock_conn, mock_cursor = self._mock_connection()
             
             task = ImportTask(
                 file_path=temp_file,
@@ -329,6 +492,252 @@ class TestSingleFileImporter:
         finally:
             os.unlink(temp_file)
     
+    def test_import_file_uses_execute_values_per_batch(self):
+        """Test that each batch of INSERT statements is sent with one execute_values call."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False, encoding='utf-8') as f:
+            for i in range(5):
+                f.write(f"INSERT INTO test (id, name) VALUES ({i}, 'data{i}');\n")
+            temp_file = f.name
+        
+        try:
+            self.mock_sql_rewriter.rewrite_insert_statement.side_effect = lambda x: x
+            
+            mock_conn, mock_cursor = self._mock_connection()
+            
+            task = ImportTask(
+                file_path=temp_file,
+                table_name="test",
+                encoding="utf-8"
+            )
+            
+            with patch('oracle_to_postgres.common.parallel_importer.execute_values') as mock_execute_values:
+                result = self.importer.import_file(task)
+            
+            # batch_size=2 -> batches of 2, 2 and 1 statements
+            assert result.success is True
+            assert result.records_processed == 5
+            assert mock_execute_values.call_count == 3
+            
+            # All batches of the file share one pooled connection
+            self.mock_db_manager.get_connection.assert_called_once_with()
+            
+            sql, rows = mock_execute_values.call_args_list[0][0][1:3]
+            assert sql == "INSERT INTO test (id, name) VALUES %s"
+            assert [str(row[0]) for row in rows] == ["(0, 'data0')", "(1, 'data1')"]
+            
+        finally:
+            os.unlink(temp_file)
+    
+    def test_import_file_without_inserts_skips_connection(self):
+        """Test that files with nothing to import do not take a connection."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False, encoding='utf-8') as f:
+            f.write("SET DEFINE OFF;\nPROMPT loading\n")
+            temp_file = f.name
+        
+        try:
+            result = self.importer.import_file(
+                ImportTask(file_path=temp_file, table_name="test", encoding="utf-8")
+            )
+            
+            assert result.success is True
+            self.mock_db_manager.get_connection.assert_not_called()
+            
+        finally:
+            os.unlink(temp_file)
+    
+    def test_import_file_overlaps_parsing_with_execution(self):
+        """Test that the next batch is rewritten while the previous one executes."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False, encoding='utf-8') as f:
+            for i in range(4):
+                f.write(f"INSERT INTO test VALUES ({i});\n")
+            temp_file = f.name
+        
+        try:
+            third_rewritten = threading.Event()
+            
+            def rewrite(statement):
+                if "(2)" in statement:
+                    third_rewritten.set()
+                return statement
+            
+            def execute_batch(batch, conn):
+                # The first batch only completes once the second is being parsed
+                if "(0)" in batch[0]:
+                    assert third_rewritten.wait(timeout=5)
+                return {'processed': len(batch), 'failed': 0, 'warnings': []}
+            
+            self.mock_sql_rewriter.rewrite_insert_statement.side_effect = rewrite
+            self._mock_connection()
+            
+            with patch.object(self.importer, '_execute_batch', side_effect=execute_batch):
+                result = self.importer.import_file(
+                    ImportTask(file_path=temp_file, table_name="test", encoding="utf-8")
+                )
+            
+            assert result.success is True
+            assert result.records_processed == 4
+            
+        finally:
+            os.unlink(temp_file)
+    
+    def test_import_file_returns_connection_after_last_batch(self):
+        """Test that the connection goes back to the pool only after the writer finished."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False, encoding='utf-8') as f:
+            for i in range(3):
+                f.write(f"INSERT INTO test VALUES ({i});\n")
+            temp_file = f.name
+        
+        try:
+            events = []
+            
+            def rewrite(statement):
+                # Fail while the first batch is still executing
+                if "(2)" in statement:
+                    raise ValueError("rewrite failed")
+                return statement
+            
+            def execute_batch(batch, conn):
+                time.sleep(0.2)
+                events.append('execute')
+                return {'processed': len(batch), 'failed': 0, 'warnings': []}
+            
+            self.mock_sql_rewriter.rewrite_insert_statement.side_effect = rewrite
+            self._mock_connection()
+            connection_context = self.mock_db_manager.get_connection.return_value
+            connection_context.__exit__.side_effect = lambda *args: events.append('putconn')
+            
+            with patch.object(self.importer, '_execute_batch', side_effect=execute_batch):
+                result = self.importer.import_file(
+                    ImportTask(file_path=temp_file, table_name="test", encoding="utf-8")
+                )
+            
+            assert result.success is False
+            assert events == ['execute', 'putconn']
+            
+        finally:
+            os.unlink(temp_file)
+    
+    def test_execute_batch_with_copy(self):
+        """Test that literal-only INSERT batches are loaded with COPY."""
+        self.importer.use_copy = True
+        
+        mock_conn, mock_cursor = self._mock_connection()
+        
+        statements = [
+            'INSERT INTO "public"."test" ("id", "name") VALUES (1, \'a\');',
+            'INSERT INTO "public"."test" ("id", "name") VALUES (2, NULL);',
+            'INSERT INTO "public"."log" ("id", "created") VALUES (3, NOW());'
+        ]
+        
+        with patch('oracle_to_postgres.common.parallel_importer.execute_values') as mock_execute_values:
+            result = self.importer._execute_batch(statements)
+        
+        assert result['processed'] == 3
+        assert result['failed'] == 0
+        
+        # Literal rows go through COPY, the NOW() row falls back to INSERT
+        mock_cursor.copy_expert.assert_called_once()
+        copy_sql, buffer = mock_cursor.copy_expert.call_args[0]
+        assert copy_sql.startswith('COPY "public"."test" ("id", "name") FROM STDIN')
+        assert buffer.getvalue() == '1,a\r\n2,\\N\r\n'
+        mock_execute_values.assert_called_once()
+    
+    def test_execute_batch_uses_copy_per_table(self):
+        """Test that interleaved tables are each loaded with one COPY."""
+        self.importer.use_copy = True
+        
+        mock_conn, mock_cursor = self._mock_connection()
+        
+        statements = [
+            'INSERT INTO "public"."a" ("id") VALUES (1);',
+            'INSERT INTO "public"."b" ("id") VALUES (2);',
+            'INSERT INTO "public"."a" ("id") VALUES (3);'
+        ]
+        
+        with patch('oracle_to_postgres.common.parallel_importer.execute_values') as mock_execute_values:
+            result = self.importer._execute_batch(statements)
+        
+        assert result['processed'] == 3
+        assert mock_execute_values.call_count == 0
+        copies = [(call[0][0].split(' FROM')[0], call[0][1].getvalue())
+                  for call in mock_cursor.copy_expert.call_args_list]
+        assert copies == [
+            ('COPY "public"."a" ("id")', '1\r\n3\r\n'),
+            ('COPY "public"."b" ("id")', '2\r\n')
+        ]
+        
+        # Queries are built once per INSERT head
+        assert list(self.importer._copy_sql_cache) == [
+            'INSERT INTO "public"."a" ("id") VALUES',
+            'INSERT INTO "public"."b" ("id") VALUES'
+        ]
+    
+    def test_iter_file_statements_with_fallback_encoding(self):
+        """Test that undecodable files are read with a fallback encoding."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.sql', delete=False) as f:
+            f.write("INSERT INTO t VALUES ('张三');\r\nINSERT INTO t\r\nVALUES (2);\r\n".encode('gbk'))
+            temp_file = f.name
+        
+        try:
+            statements = list(self.importer._iter_file_statements(temp_file, 'utf-8'))
+            
+            assert statements == ["INSERT INTO t VALUES ('张三');", "INSERT INTO t\nVALUES (2);"]
+            self.mock_logger.warning.assert_called_once()
+        finally:
+            os.unlink(temp_file)
+    
+    def test_iter_file_statements_across_chunks(self):
+        """Test that statements spanning read chunks are streamed intact."""
+        content = ("INSERT INTO t VALUES ('a;b', '张三');\r\n"
+                   "INSERT INTO t VALUES ('it\\'s', '乗');\r\n"
+                   "INSERT INTO t VALUES (3)")
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.sql', delete=False) as f:
+            f.write(content.encode('gbk'))
+            temp_file = f.name
+        
+        try:
+            with patch('oracle_to_postgres.common.parallel_importer.READ_CHUNK_SIZE', 5):
+                statements = list(self.importer._iter_file_statements(temp_file, 'gbk'))
+            
+            assert statements == [
+                "INSERT INTO t VALUES ('a;b', '张三');",
+                "INSERT INTO t VALUES ('it\\'s', '乗');",
+                "INSERT INTO t VALUES (3)"
+            ]
+        finally:
+            os.unlink(temp_file)
+    
+    def test_iter_file_statements_scans_chunks_once(self):
+        """Test that a statement spanning many chunks is not rescanned for each chunk."""
+        content = "SELECT 'unterminated;\n" + "INSERT INTO t VALUES (1);\n" * 200
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.sql', delete=False) as f:
+            f.write(content.encode('utf-8'))
+            temp_file = f.name
+        
+        module = 'oracle_to_postgres.common.sql_rewriter'
+        patterns = {
+            name: Mock(wraps=getattr(sql_rewriter, name))
+            for name in ('SQL_STATEMENT_PATTERN', 'SQL_STATEMENT_PREFIX_PATTERN', 'SQL_QUOTED_REST_PATTERN')
+        }
+        try:
+            with patch('oracle_to_postgres.common.parallel_importer.READ_CHUNK_SIZE', 10), \
+                 patch.multiple(module, **patterns), \
+                 patch('oracle_to_postgres.common.parallel_importer.SQL_STATEMENT_PATTERN',
+                       patterns['SQL_STATEMENT_PATTERN']):
+                statements = list(self.importer._iter_file_statements(temp_file, 'utf-8'))
+            
+            assert statements == [content.strip()]
+            
+            # Every regex call scans from its start position to the end of its text
+            scanned = sum(
+                len(call.args[0]) - (call.args[1] if len(call.args) > 1 else 0)
+                for pattern in patterns.values()
+                for call in pattern.method_calls
+            )
+            assert 0 < scanned <= 3 * len(content)
+        finally:
+            os.unlink(temp_file)
+    
     def test_import_file_with_error(self):
         """Test file import with error."""
         task = ImportTask(
@@ -351,9 +760,9 @@ class TestParallelImporter:
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.mock_db_manager = Mock(spec=DatabaseManager)
-        self.mock_sql_rewriter = Mock(spec=SQLRewriter)
-        self.mock_logger = Mock(spec=Logger)
+        self.mock_db_manager = Mock(spec_set=DatabaseManager)
+        self.mock_sql_rewriter = Mock(spec_set=SQLRewriter)
+        self.mock_logger = Mock(spec_set=Logger)
         
         self.importer = ParallelImporter(
             db_manager=self.mock_db_manager,
@@ -439,6 +848,134 @@ class TestParallelImporter:
                 except:
                     pass
     
+    @patch('oracle_to_postgres.common.parallel_importer.SingleFileImporter')
+    def test_import_files_single_task_runs_inline(self, mock_single_importer_class):
+        """Test that a single file is imported without starting a worker pool."""
+        result = ImportResult(
+            file_path="/test.sql",
+            table_name="test",
+            success=True,
+            records_processed=10,
+            records_failed=0,
+            processing_time=1.0
+        )
+        mock_single_importer_class.return_value.import_file.return_value = result
+        
+        with patch('oracle_to_postgres.common.parallel_importer.ThreadPoolExecutor') as mock_thread_pool:
+            results = self.importer.import_files(
+                [ImportTask(file_path="/test.sql", table_name="test", encoding="utf-8")]
+            )
+        
+        assert results == [result]
+        mock_thread_pool.assert_not_called()
+        assert self.importer.get_statistics()['successful_records'] == 10
+        assert self.importer.get_progress().completed_files == 1
+    
+    def test_import_files_with_process_pool(self):
+        """Test importing files in worker processes with real components."""
+        db_manager = DatabaseManager(ConnectionInfo(
+            host="localhost", port=5432, database="test",
+            username="test", password="test"
+        ))
+        sql_rewriter = SQLRewriter(source_db="ORCL", target_db="test")
+        importer = ParallelImporter(
+            db_manager=db_manager,
+            sql_rewriter=sql_rewriter,
+            max_workers=2,
+            use_multiprocessing=True,
+            serial_threshold=0
+        )
+        
+        # Oracle client commands are skipped, so no database access is needed
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False, encoding='utf-8') as f:
+            f.write("SET DEFINE OFF;\nCOMMIT;\n")
+            temp_file = f.name
+        
+        try:
+            assert importer._use_process_pool() is True
+            
+            completed = []
+            results = importer.import_files(
+                [ImportTask(file_path=temp_file, table_name="test", encoding="utf-8")],
+                progress_callback=lambda progress: completed.append(progress.completed_files)
+            )
+            
+            assert len(results) == 1
+            assert results[0].success is True
+            assert results[0].records_processed == 0
+            assert completed == [1]
+        finally:
+            os.unlink(temp_file)
+    
+    def test_init_import_worker_keeps_rules_and_log_level(self, monkeypatch):
+        """Test that worker processes keep custom rewrite rules and the log level."""
+        sql_rewriter = SQLRewriter(source_db="ORCL", target_db="test")
+        sql_rewriter.add_custom_rule(r"\bLEGACY_ORDERS\b", "orders", "Custom rule")
+        importer = ParallelImporter(
+            db_manager=DatabaseManager(ConnectionInfo(
+                host="localhost", port=5432, database="test",
+                username="test", password="test"
+            )),
+            sql_rewriter=sql_rewriter,
+            logger=Logger("DEBUG", name="test_worker"),
+            use_multiprocessing=True
+        )
+        
+        with patch('oracle_to_postgres.common.parallel_importer.ProcessPoolExecutor') as mock_process_pool:
+            importer._create_executor(True, 2)
+        worker_config = mock_process_pool.call_args.kwargs['initargs'][0]
+        
+        monkeypatch.setattr(parallel_importer, '_worker_importer', None)
+        parallel_importer._init_import_worker(worker_config)
+        worker_importer = parallel_importer._worker_importer
+        
+        assert worker_config.log_level == "DEBUG"
+        assert worker_importer.logger.logger.level == logging.DEBUG
+        assert worker_importer.sql_rewriter.rewrite_rules[-1].description == "Custom rule"
+        assert worker_importer.sql_rewriter.rewrite_insert_statement(
+            "INSERT INTO legacy_orders (id) VALUES (1)") == 'INSERT INTO "public"."orders" ("id") VALUES (1)'
+    
+    def test_free_threaded_detected(self, monkeypatch):
+        """Test that free-threaded interpreters use threads instead of processes."""
+        monkeypatch.setattr(sys, '_is_gil_enabled', lambda: False, raising=False)
+        
+        db_manager = DatabaseManager(ConnectionInfo(
+            host="localhost", port=5432, database="test",
+            username="test", password="test"
+        ))
+        sql_rewriter = SQLRewriter(source_db="ORCL", target_db="test")
+        importer = ParallelImporter(
+            db_manager=db_manager,
+            sql_rewriter=sql_rewriter,
+            max_workers=2,
+            use_multiprocessing=True,
+            serial_threshold=0
+        )
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False, encoding='utf-8') as f:
+            f.write("SET DEFINE OFF;\n")
+            temp_file = f.name
+        
+        try:
+            with patch('oracle_to_postgres.common.parallel_importer.ThreadPoolExecutor',
+                       wraps=ThreadPoolExecutor) as mock_thread_pool, \
+                    patch('oracle_to_postgres.common.parallel_importer.ProcessPoolExecutor') as mock_process_pool:
+                results = importer.import_files(
+                    [ImportTask(file_path=temp_file, table_name="test", encoding="utf-8")]
+                )
+            
+            assert importer._free_threaded is True
+            assert results[0].success is True
+            # Pool is sized to the single task
+            mock_thread_pool.assert_any_call(max_workers=1)
+            mock_process_pool.assert_not_called()
+        finally:
+            os.unlink(temp_file)
+    
+    def test_mocked_components_use_threads(self):
+        """Test that the default configuration keeps the thread pool."""
+        assert self.importer._use_process_pool() is False
+    
     def test_progress_callback(self):
         """Test progress callback functionality."""
         callback_calls = []
@@ -497,6 +1034,36 @@ class TestParallelImporter:
         assert stats['successful_records'] == 150
         assert stats['failed_records'] == 15
         assert stats['total_records'] == 165
+    
+    def test_statistics_thread_safety(self):
+        """Test statistics updates from concurrent threads."""
+        self.importer._reset_statistics()
+        
+        result = ImportResult(
+            file_path="/test.sql",
+            table_name="test_table",
+            success=True,
+            records_processed=10,
+            records_failed=1,
+            processing_time=1.0
+        )
+        
+        def worker():
+            for _ in range(1000):
+                self.importer._update_statistics(result)
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        stats = self.importer.get_statistics()
+        assert stats['successful_files'] == 4000
+        assert stats['successful_records'] == 40000
+        assert stats['failed_records'] == 4000
+        assert stats['total_records'] == 44000
+        assert self.importer.import_stats == stats
 
 
 if __name__ == '__main__':
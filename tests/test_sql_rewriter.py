@@ -2,11 +2,14 @@
 Tests for SQL rewriting functionality.
 """
 
+import re
 import pytest
 import tempfile
 import os
+from oracle_to_postgres.common import sql_rewriter
 from oracle_to_postgres.common.sql_rewriter import (
-    SQLRewriter, BatchSQLRewriter, PostgreSQLCompatibilityChecker, RewriteRule
+    SQLRewriter, BatchSQLRewriter, PostgreSQLCompatibilityChecker, RewriteRule,
+    extract_rule_trigger, fold_case, fold_rule_pattern, parse_replacement_template
 )
 from oracle_to_postgres.common.logger import Logger
 
@@ -35,6 +38,12 @@ class TestSQLRewriter:
         result = self.rewriter.rewrite_insert_statement(sql)
         assert '"public"."users"' in result
     
+    def test_history_view_prefix_removal(self):
+        """Test V_HIS_ view prefixes are removed from INSERT table names."""
+        sql = 'INSERT INTO "HIS"."V_HIS_ORDERS" (id) SELECT id FROM V_HIS_ITEMS'
+        result = self.rewriter.rewrite_insert_statement(sql)
+        assert result == 'INSERT INTO "HIS"."ORDERS" (id) SELECT id FROM ITEMS'
+    
     def test_oracle_date_conversion(self):
         """Test Oracle TO_DATE conversion to PostgreSQL."""
         sql = "INSERT INTO events (id, created_date) VALUES (1, TO_DATE('2023-01-01', 'YYYY-MM-DD'))"
@@ -42,6 +51,13 @@ class TestSQLRewriter:
         assert "TO_DATE" not in result
         assert "'2023-01-01'::timestamp" in result
     
+    def test_date_format_conversion_ascii_digits_only(self):
+        """Test only ASCII digit dates are reordered and cast."""
+        sql = "INSERT INTO events (id, a, b) VALUES (1, '12-07-2022', '１２-０７-２０２２')"
+        result = self.rewriter.rewrite_insert_statement(sql)
+        assert "'2022-07-12'::date" in result
+        assert "'１２-０７-２０２２')" in result
+    
     def test_sysdate_conversion(self):
         """Test Oracle SYSDATE conversion to PostgreSQL NOW()."""
         sql = "INSERT INTO logs (id, timestamp) VALUES (1, SYSDATE)"
@@ -131,6 +147,129 @@ class TestSQLRewriter:
         assert len(statements) == 3
         assert all("INSERT" in stmt or "UPDATE" in stmt for stmt in statements)
     
+    def test_rewrite_sql_file_with_encoding(self):
+        """Test rewriting a GBK encoded file into UTF-8."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = os.path.join(temp_dir, "source.sql")
+            with open(source_file, 'w', encoding='gbk') as f:
+                f.write("INSERT INTO users (id, name) VALUES (1, '张三;李四');\n"
+                        "INSERT INTO users (id, name) VALUES (2, SYSDATE);\n")
+            
+            target_file = os.path.join(temp_dir, "out", "target.sql")
+            assert self.rewriter.rewrite_sql_file(source_file, target_file, 'gbk', 'utf-8')
+            
+            with open(target_file, 'r', encoding='utf-8') as f:
+                lines = f.read().split('\n')
+            
+            assert len(lines) == 2
+            assert "'张三;李四'" in lines[0]
+            assert "NOW()" in lines[1]
+    
+    def test_rewrite_sql_file_with_backslash_trail_byte(self):
+        """Test GBK characters whose trail byte is a backslash before a quote."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = os.path.join(temp_dir, "source.sql")
+            with open(source_file, 'w', encoding='gbk') as f:
+                # '乗' is encoded as 0x81 0x5C in GBK
+                f.write("INSERT INTO users (id, name) VALUES (1, '乗');\n"
+                        "INSERT INTO users (id, name) VALUES (2, 'b');\n")
+            
+            target_file = os.path.join(temp_dir, "target.sql")
+            assert self.rewriter.rewrite_sql_file(source_file, target_file, 'gbk', 'utf-8')
+            
+            with open(target_file, 'r', encoding='utf-8') as f:
+                lines = f.read().split('\n')
+            
+            assert len(lines) == 2
+            assert "'乗'" in lines[0]
+            assert "'b'" in lines[1]
+    
+    def test_rewrite_sql_file_streams_in_chunks(self, monkeypatch):
+        """Test statements spanning read chunks and write batches are kept intact."""
+        monkeypatch.setattr('oracle_to_postgres.common.sql_rewriter.READ_CHUNK_SIZE', 7)
+        monkeypatch.setattr('oracle_to_postgres.common.sql_rewriter.REWRITE_BATCH_SIZE', 3)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = os.path.join(temp_dir, "source.sql")
+            with open(source_file, 'w', encoding='gbk') as f:
+                for i in range(20):
+                    f.write(f"INSERT INTO users (id, name) VALUES ({i}, '张三;\\'{i}');\n")
+            
+            target_file = os.path.join(temp_dir, "target.sql")
+            assert self.rewriter.rewrite_sql_file(source_file, target_file, 'gbk', 'utf-8')
+            
+            with open(target_file, 'r', encoding='utf-8') as f:
+                lines = f.read().split('\n')
+            
+            assert len(lines) == 20
+            assert all(f"VALUES ({i}, '张三;\\'{i}');" in line for i, line in enumerate(lines))
+    
+    def test_rewrite_sql_file_scans_chunks_once(self, monkeypatch):
+        """Test a statement spanning many chunks is not rescanned for each chunk."""
+        scanned = []
+        
+        class CountingPattern:
+            def __init__(self, pattern):
+                self.pattern = pattern
+            
+            def match(self, text, pos=0):
+                scanned.append(len(text) - pos)
+                return self.pattern.match(text, pos)
+            
+            def finditer(self, text, pos=0):
+                scanned.append(len(text) - pos)
+                return self.pattern.finditer(text, pos)
+        
+        module = 'oracle_to_postgres.common.sql_rewriter'
+        for name in ('SQL_STATEMENT_PATTERN', 'SQL_STATEMENT_PREFIX_PATTERN', 'SQL_QUOTED_REST_PATTERN'):
+            monkeypatch.setattr(f'{module}.{name}', CountingPattern(getattr(sql_rewriter, name)))
+        monkeypatch.setattr(f'{module}.READ_CHUNK_SIZE', 10)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # An unterminated quote leaves the whole file in one statement
+            content = "SELECT 'unterminated;\n" + "INSERT INTO users (id) VALUES (1);\n" * 200
+            source_file = os.path.join(temp_dir, "source.sql")
+            with open(source_file, 'w', encoding='gbk') as f:
+                f.write(content)
+            
+            statements = list(self.rewriter._iter_file_statements(source_file, 'gbk'))
+        
+        assert statements == [content.strip()]
+        assert sum(scanned) <= 3 * len(content)
+    
+    def test_rewrite_sql_file_translates_line_endings(self):
+        """Test CRLF and CR line endings are read as newlines, like text mode."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = os.path.join(temp_dir, "source.sql")
+            with open(source_file, 'wb') as f:
+                f.write(b"INSERT INTO users (id, name)\r\nVALUES (1, 'a');\r\n"
+                        b"INSERT INTO users (id, name)\rVALUES (2, 'b');\r")
+            
+            target_file = os.path.join(temp_dir, "target.sql")
+            assert self.rewriter.rewrite_sql_file(source_file, target_file, 'utf-8', 'utf-8')
+            
+            # Read without newline translation, only the platform's own
+            # line separator written in text mode is expected
+            with open(target_file, 'r', encoding='utf-8', newline='') as f:
+                content = f.read().replace(os.linesep, '\n')
+            
+            assert '\r' not in content
+            assert content.split('\n') == [
+                'INSERT INTO "public"."users" ("id", "name")', "VALUES (1, 'a');",
+                'INSERT INTO "public"."users" ("id", "name")', "VALUES (2, 'b');"
+            ]
+    
+    def test_rewrite_batch(self):
+        """Test batch rewriting matches rewriting statements one at a time."""
+        statements = [
+            "INSERT INTO ORCL.users (id, created) VALUES (1, SYSDATE);",
+            "SELECT NVL(name, 'x') FROM ORCL.users;",
+            "UPDATE ORCL.users SET created = SYSDATE;",
+        ]
+        expected = [self.rewriter._rewrite_statement(statement) for statement in statements]
+        
+        assert self.rewriter.rewrite_batch(iter(statements)) == expected
+        assert self.rewriter.rewrite_batch([]) == []
+    
     def test_custom_rule_addition(self):
         """Test adding custom rewrite rules."""
         self.rewriter.add_custom_rule(
@@ -156,6 +295,32 @@ class TestSQLRewriter:
         assert any("database name" in desc for desc in stats.keys())
         assert any("SYSDATE" in desc for desc in stats.keys())
 
+    def test_repeated_insert_uses_cache(self):
+        """Test identical INSERT statements are rewritten once but counted each time."""
+        self.rewriter.reset_statistics()
+        
+        sql = "INSERT INTO ORCL.users (id, created) VALUES (1, SYSDATE)"
+        first = self.rewriter.rewrite_insert_statement(sql)
+        second = self.rewriter.rewrite_insert_statement(sql)
+        
+        assert first == second
+        assert self.rewriter._rewrite_insert_cached.cache_info().hits == 1
+        stats = self.rewriter.get_rewrite_statistics()
+        assert stats["Replace Oracle SYSDATE with PostgreSQL NOW()"] == 2
+    
+    def test_fused_literal_rules(self):
+        """Test consecutive literal rules are applied in one pass with per-rule statistics."""
+        self.rewriter.reset_statistics()
+
+        sql = "SELECT NVL(a, 0), NVL(b, 0), CAST(c AS VARCHAR2(10)) FROM t WHERE d = ''"
+        result = self.rewriter._apply_general_rules(sql)
+
+        assert result == "SELECT COALESCE(a, 0), COALESCE(b, 0), CAST(c AS VARCHAR(10)) FROM t WHERE d IS NULL"
+        stats = self.rewriter.get_rewrite_statistics()
+        assert stats["Replace Oracle NVL with PostgreSQL COALESCE"] == 1
+        assert stats["Replace Oracle VARCHAR2 with PostgreSQL VARCHAR"] == 1
+        assert stats["Convert Oracle empty string comparison to NULL check"] == 1
+
 
 class TestBatchSQLRewriter:
     """Test cases for BatchSQLRewriter class."""
@@ -211,6 +376,42 @@ class TestBatchSQLRewriter:
             assert 'rules_used' in stats
             assert stats['total_transformations'] > 0
 
+    
+    def test_batch_file_rewriting_in_process_pool(self):
+        """Test several files are rewritten by worker processes with merged statistics."""
+        batch_rewriter = BatchSQLRewriter(
+            source_db="ORCL",
+            target_db="postgres_db",
+            target_schema="public",
+            max_workers=2
+        )
+        batch_rewriter.sql_rewriter.add_custom_rule(
+            pattern=r'\bCUSTOM_FUNC\b',
+            replacement='pg_custom_func',
+            description="Custom function replacement"
+        )
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_mappings = []
+            for i in range(3):
+                source_file = os.path.join(temp_dir, f"source{i}.sql")
+                with open(source_file, 'w', encoding='utf-8') as f:
+                    f.write(f"INSERT INTO users (id, created) VALUES ({i}, CUSTOM_FUNC(SYSDATE));")
+                file_mappings.append((source_file, os.path.join(temp_dir, f"target{i}.sql"), 'utf-8'))
+            file_mappings.append((os.path.join(temp_dir, "missing.sql"),
+                                  os.path.join(temp_dir, "missing_out.sql"), 'utf-8'))
+            
+            results = batch_rewriter.rewrite_files(file_mappings)
+            
+            assert results == [True, True, True, False]
+            for i in range(3):
+                with open(file_mappings[i][1], 'r', encoding='utf-8') as f:
+                    assert f"VALUES ({i}, pg_custom_func(NOW()))" in f.read()
+            
+            stats = batch_rewriter.get_combined_statistics()['rewrite_rules_applied']
+            assert stats["Custom function replacement"] == 3
+            assert stats["Replace Oracle SYSDATE with PostgreSQL NOW()"] == 3
+
 
 class TestPostgreSQLCompatibilityChecker:
     """Test cases for PostgreSQLCompatibilityChecker class."""
@@ -271,6 +472,26 @@ class TestPostgreSQLCompatibilityChecker:
         issue_types = set(issue['matched_text'].upper() for issue in issues)
         assert len(issue_types) >= 4  # ROWID, DECODE, ROWNUM, START WITH, CONNECT BY
     
+    def test_hyperscan_matches_re_scanner(self):
+        """Test hyperscan and re scanners report the same issues."""
+        pytest.importorskip('hyperscan')
+        fallback = PostgreSQLCompatibilityChecker()
+        fallback._hyperscan_db = None
+        sql = """
+        SELECT rowid, Decode (status, 'A', 'Active'), to_char(created)
+        FROM users WHERE ROWNUM <= 10 AND xROWID = 1
+        START\tWITH parent_id IS NULL CONNECT
+          BY PRIOR id = parent_id
+        """
+        
+        issues = self.checker.check_compatibility(sql)
+        
+        assert self.checker._hyperscan_db is not None
+        assert issues == fallback.check_compatibility(sql)
+        assert [i['matched_text'] for i in issues] == [
+            'CONNECT\n          BY', 'START\tWITH', 'rowid', 'ROWNUM', 'Decode (', 'to_char('
+        ]
+    
     def test_compatibility_report_generation(self):
         """Test compatibility report generation."""
         sql = "SELECT ROWID FROM users WHERE ROWNUM <= 5"
@@ -308,6 +529,61 @@ class TestRewriteRule:
         assert rule.replacement == 'REPLACEMENT'
         assert rule.description == 'Test rule'
         assert rule.flags == 2  # re.IGNORECASE
+        assert rule.compiled.pattern == rule.pattern
+        assert rule.compiled.flags & rule.flags
+        assert rule.compiled.sub(rule.replacement, 'a test') == 'a REPLACEMENT'
+        assert rule.trigger == 'test'
+    
+    def test_rule_trigger_extraction(self):
+        """Test trigger words are only derived from required literal text."""
+        assert extract_rule_trigger(r'\bNVL\s*\(') == 'nvl'
+        assert extract_rule_trigger(r'(\w+)\.NEXTVAL') == 'nextval'
+        assert extract_rule_trigger(r'\bROWNUM\s*<=?\s*(\d+)') == 'rownum'
+        assert extract_rule_trigger(r'VARCHAR2?') == 'varchar'
+        assert extract_rule_trigger(r"=\s*''") == ''
+        assert extract_rule_trigger(r'FOO|BAR') == ''
+        assert extract_rule_trigger(r'(?:FOO)?BARBAZ') == ''
+        assert extract_rule_trigger(r'\x41\d{123}') == ''
+    
+    def test_rule_pattern_folding(self):
+        """Test case-insensitive rule patterns are folded to case-sensitive ones."""
+        assert fold_rule_pattern(r'\bSYSDATE\b') == r'sysdate(?<!\wsysdate)\b'
+        assert fold_rule_pattern(r'(\w+)\.NEXTVAL') == r'(\w+)\.nextval'
+        assert fold_rule_pattern(r"TO_DATE\s*\(\s*'([^']+)'") == r"to_date\s*\(\s*'([^']+)'"
+        assert fold_rule_pattern(r'\bSYSDATE\b', flags=0) is None
+        assert fold_rule_pattern(r'[A-Z]+') is None
+        assert fold_rule_pattern(r'(?P<name>X)') is None
+        assert fold_rule_pattern(r'\x41') is None
+    
+    def test_replacement_template_parsing(self):
+        """Test replacements are split into literals and group references."""
+        compiled = re.compile(r'(?P<schema>\w+)\.(\w+)')
+        
+        assert parse_replacement_template(compiled, r'"\g<schema>"."\2"') == (('"', '"."', '"'), (1, 2))
+        assert parse_replacement_template(compiled, r'\g<0>') == (('', ''), (0,))
+        assert parse_replacement_template(compiled, 'NOW()') == (('NOW()',), ())
+        assert parse_replacement_template(compiled, r'\3') is None
+        assert parse_replacement_template(compiled, r'\123') is None
+        assert parse_replacement_template(compiled, r'\1\n') is None
+    
+    def test_folded_rule_matches_original_rule(self):
+        """Test rules applied through their scanner give the same result."""
+        rule = RewriteRule(
+            pattern=r'INSERT\s+INTO\s+(\w+)\.(\w+)',
+            replacement=r'INSERT INTO "public"."\2"',
+            description='Test rule'
+        )
+        sql = "insert INTO ORCL.Users VALUES ('ſ', 'İ'); Insert into a.b VALUES (1)"
+        
+        assert rule.scanner is not None
+        assert (SQLRewriter._substitute(rule, sql, fold_case(sql)) ==
+                rule.compiled.sub(rule.replacement, sql))
+    
+    def test_rule_trigger_skip_keeps_case_insensitive_matches(self):
+        """Test rules still run for non-ASCII characters matching ASCII letters."""
+        rewriter = SQLRewriter(source_db="ORCL", target_db="postgres_db")
+        result = rewriter._apply_general_rules("SELECT \u017fYSDATE FROM t")
+        assert result == "SELECT NOW() FROM t"
 
 
 if __name__ == '__main__':